@@ -9,6 +9,7 @@ from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
 
 from social_graph.graph import Graph
+from social_graph.cache import QueryCache
 
 from gui.add_user_dialog import AddUserDialog
 from gui.add_friend_dialog import AddFriendDialog
@@ -17,6 +18,8 @@ from gui.dfs_window import DFSWindow
 from gui.community_window import CommunityWindow
 from gui.recommendation_window import RecommendationWindow
 from gui.graph_view_window import GraphViewWindow
+from gui.graph_canvas import GraphScene
+from gui.workers import TaskRunner
 
 
 class MainWindow(QMainWindow):
@@ -30,9 +33,20 @@ class MainWindow(QMainWindow):
         self.resize(900, 600)
         self.setMinimumSize(750, 500)
 
-        # Load graph
+        # Load graph (snapshot + mutation log), then log further edits
         self.graph = Graph()
         self.graph.load()
+        self.graph.enable_log()
+        # Query results shared by the BFS/DFS/recommendation windows
+        self.cache = QueryCache(self.graph)
+        # Background worker for the algorithm windows (one task at a time)
+        self.tasks = TaskRunner(self)
+        # One scene model for every canvas, kept in step with the graph
+        # through its observer; built the first time a canvas is opened
+        self.scene = None
+        # Editing dialog waiting for a cancelled search to finish
+        self._pending_edit = None
+        self._close_pending = False
 
         # =======================================================
         # COMPLETELY NEW THEME (Lavender & Purple)
@@ -150,37 +164,85 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
 
     def _refresh_and_save(self):
-        self.graph.save()
+        # O(1): flushes the mutation log, checkpoints in the background
+        self.graph.sync()
+
+    def closeEvent(self, event):
+        # A cancelled search may still be running: close once it is done
+        self.tasks.cancel()
+        if not self.tasks.is_idle():
+            event.ignore()
+            if not self._close_pending:
+                self._close_pending = True
+                self.tasks.when_idle(self.close)
+            return
+
+        # Fold the log into graph_data.json before quitting
+        if self.scene is not None:
+            self.scene.detach()
+            self.scene.layout_tasks.wait()
+        self.graph.checkpoint()
+        self.graph.close_log()
+        super().closeEvent(event)
 
     # =======================================================
     # Button Handlers
     # =======================================================
+    def _when_safe_to_edit(self, open_dialog):
+        # A cancelled search may still be reading the graph on the worker
+        # thread; open the editing dialog once it has finished, without
+        # blocking the event loop meanwhile.
+        self.tasks.cancel()
+        waiting = self._pending_edit is not None
+        self._pending_edit = open_dialog    # a later click replaces an earlier one
+        if not waiting:
+            self.tasks.when_idle(self._open_pending_edit)
+
+    def _open_pending_edit(self):
+        open_dialog, self._pending_edit = self._pending_edit, None
+        open_dialog()
+
     def open_add_user(self):
+        self._when_safe_to_edit(self._add_user)
+
+    def _add_user(self):
         dlg = AddUserDialog(self.graph)
         if dlg.exec_():
             self._refresh_and_save()
 
     def open_add_friend(self):
+        self._when_safe_to_edit(self._add_friend)
+
+    def _add_friend(self):
         dlg = AddFriendDialog(self.graph)
         if dlg.exec_():
             self._refresh_and_save()
 
+    def _graph_scene(self):
+        if self.scene is None:
+            self.scene = GraphScene(self.graph)
+        return self.scene
+
     def open_bfs(self):
-        BFSWindow(self.graph).exec_()
+        BFSWindow(self.graph, self.cache, self.tasks, self._graph_scene()).exec_()
 
     def open_dfs(self):
-        DFSWindow(self.graph).exec_()
+        DFSWindow(self.graph, self.cache, self.tasks, self._graph_scene()).exec_()
 
     def open_community(self):
-        CommunityWindow(self.graph).exec_()
+        CommunityWindow(self.graph, self.tasks, self._graph_scene()).exec_()
 
     def open_recommendation(self):
-        RecommendationWindow(self.graph).exec_()
+        RecommendationWindow(self.graph, self.cache, self.tasks, self._graph_scene()).exec_()
 
     def open_graph_view(self):
-        GraphViewWindow(self.graph).exec_()
+        # users can be deleted from the graph view
+        self._when_safe_to_edit(lambda: GraphViewWindow(self.graph).exec_())
 
     def open_delete_friendship(self):
+        self._when_safe_to_edit(self._delete_friendship)
+
+    def _delete_friendship(self):
         from gui.delete_friend_dialog import DeleteFriendDialog
         dlg = DeleteFriendDialog(self.graph)
         if dlg.exec_():
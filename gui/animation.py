@@ -0,0 +1,127 @@
+# gui/animation.py
+
+import math
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Frame planning for the BFS / DFS animators. Kept free of Qt so the
+# timeline logic can be tested on its own.
+
+STEP_LIMIT = 60         # traversals up to this size animate one node per frame
+TARGET_FRAMES = 240     # larger ones are spread over about this many frames
+
+VISITED = "visited"
+FRONTIER = "frontier"
+PATH = "path"
+
+State = Tuple[int, int, int]
+
+
+def frame_size(count: int, target: int = TARGET_FRAMES) -> int:
+    # Nodes per frame so that count nodes take about target frames
+    return max(1, math.ceil(count / target))
+
+
+def chunk_bounds(count: int, size: int) -> List[int]:
+    """Frame boundaries for count nodes, size nodes per frame."""
+    bounds = list(range(0, count, size))
+    bounds.append(count)
+    return bounds
+
+
+def level_bounds(levels: Sequence[Optional[int]], max_size: Optional[int] = None) -> List[int]:
+    """
+    Frame boundaries that follow BFS levels: a new frame starts wherever
+    the level changes along the visiting order (levels[i] is the distance
+    of the i-th visited node). Levels larger than max_size are split.
+    """
+    bounds = [0]
+    for i in range(1, len(levels)):
+        if levels[i] != levels[i - 1] or (max_size and i - bounds[-1] >= max_size):
+            bounds.append(i)
+    if levels:
+        bounds.append(len(levels))
+    return bounds
+
+
+class Timeline:
+    """
+    Precomputed frames of a traversal animation.
+
+    Exploration frame f (1..E) shows order[bounds[f-1]:bounds[f]] as the
+    frontier and everything visited before it as visited; the following
+    frames light up the path, path_size nodes at a time. Frame 0 is the
+    uncolored graph.
+
+    The state after any frame is just three offsets (visited end,
+    frontier end, path end), so every frame is its own snapshot: seeking
+    from one frame to another recolors only the nodes whose color differs
+    between the two (diff), never the whole graph.
+    """
+
+    def __init__(
+        self,
+        order: Sequence[Hashable],
+        bounds: Sequence[int],
+        path: Sequence[Hashable] = (),
+        path_size: int = 1,
+    ) -> None:
+        self.order = list(order)
+        self.bounds = list(bounds) or [0]
+        self.path = list(path)
+        self.path_size = max(1, path_size)
+
+        self.explore_frames = len(self.bounds) - 1
+        self.last_frame = self.explore_frames + math.ceil(len(self.path) / self.path_size)
+
+        # a DFS may re-enter a node, so a node can sit at several offsets
+        self._offsets: Dict[Hashable, List[int]] = {}
+        for i, node in enumerate(self.order):
+            self._offsets.setdefault(node, []).append(i)
+        self._path_rank = {}
+        for i, node in enumerate(self.path):
+            self._path_rank.setdefault(node, i)
+
+    def state(self, frame: int) -> State:
+        frame = max(0, min(frame, self.last_frame))
+        if frame == 0:
+            return 0, 0, 0
+        explored = min(frame, self.explore_frames)
+        visited_end = self.bounds[explored - 1] if explored else 0
+        frontier_end = self.bounds[explored]
+        path_end = min(len(self.path), (frame - explored) * self.path_size)
+        return visited_end, frontier_end, path_end
+
+    def color(self, node: Hashable, state: State) -> Optional[str]:
+        visited_end, frontier_end, path_end = state
+        if self._path_rank.get(node, path_end) < path_end:
+            return PATH
+        color = None
+        for i in self._offsets.get(node, ()):
+            if i >= frontier_end:
+                break
+            if i >= visited_end:
+                return FRONTIER
+            color = VISITED
+        return color
+
+    def diff(self, start: int, end: int) -> Dict[Optional[str], List[Hashable]]:
+        """
+        Nodes to recolor to go from frame start to frame end, grouped by
+        their new color (None = back to the default color).
+        """
+        a = self.state(start)
+        b = self.state(end)
+
+        candidates = self.order[min(a[0], b[0]):max(a[1], b[1])]
+        candidates += self.path[min(a[2], b[2]):max(a[2], b[2])]
+
+        changes: Dict[Optional[str], List[Hashable]] = {}
+        seen = set()
+        for node in candidates:
+            if node in seen:
+                continue
+            seen.add(node)
+            new = self.color(node, b)
+            if new != self.color(node, a):
+                changes.setdefault(new, []).append(node)
+        return changes
@@ -2,21 +2,27 @@
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QTextEdit, QMessageBox, QWidget, QScrollArea
+    QComboBox, QTextEdit, QMessageBox, QWidget, QScrollArea, QSlider
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
-from social_graph.bfs import bfs_shortest_path
+from social_graph.cache import QueryCache
 from .graph_canvas import GraphCanvas
 from .bfs_animator import BFSAnimator
+from .workers import TaskRunner
 
 
 class BFSWindow(QDialog):
-    def __init__(self, graph):
+    def __init__(self, graph, cache=None, tasks=None, scene=None):
         super().__init__()
 
         self.graph = graph
+        # An empty QueryCache is falsy (__len__), so test for None
+        self._owns_cache = cache is None
+        self.cache = QueryCache(graph) if cache is None else cache
+        self.tasks = tasks or TaskRunner(self)
+        self.scene = scene    # shared GraphScene (None → canvas builds its own)
         self.animator = None
 
         # Much more compact & visible
@@ -72,6 +78,10 @@ class BFSWindow(QDialog):
         self.combo_end.setMinimumHeight(36)
         left_layout.addWidget(self.combo_end)
 
+        # A search still running for the old inputs is abandoned
+        self.combo_start.currentTextChanged.connect(self._inputs_changed)
+        self.combo_end.currentTextChanged.connect(self._inputs_changed)
+
         # Run BFS Button ---------------------------------------
         self.btn_run = QPushButton("Run BFS")
         self.btn_run.setObjectName("runButton")
@@ -99,6 +109,12 @@ class BFSWindow(QDialog):
         self.btn_step.clicked.connect(self.step_anim)
         self.btn_restart.clicked.connect(self.restart_anim)
 
+        # Timeline: drag to jump to any frame of the animation
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, 0)
+        self.slider.valueChanged.connect(self.seek_anim)
+        left_layout.addWidget(self.slider)
+
         # DETAILS LABEL ----------------------------------------
         lbl_details = QLabel("Details:")
         lbl_details.setObjectName("SectionLabel")
@@ -116,7 +132,7 @@ class BFSWindow(QDialog):
         # ======================================================
         # RIGHT PANEL — Graph Canvas
         # ======================================================
-        self.canvas = GraphCanvas(self.graph)
+        self.canvas = GraphCanvas(self.graph, scene=self.scene)
 
         root.addWidget(scroll_area, 0)  # never expands too large
         root.addWidget(self.canvas, 1)   # canvas expands instead
@@ -234,6 +250,7 @@ class BFSWindow(QDialog):
 
         for b in buttons:
             b.setEnabled(not disable_all)
+        self.slider.setEnabled(not disable_all)
 
         if disable_all:
             for b in buttons:
@@ -253,8 +270,19 @@ class BFSWindow(QDialog):
             self.output.setText("⚠ Start and Target cannot be the same.")
             return
 
-        result = bfs_shortest_path(self.graph, start, end, return_full_result=True)
-
+        # Search runs on the worker thread; results come back to _show_result
+        self.output.setText("⏳ Running BFS...")
+        self._update_button_states(disable_all=True)
+        self.animator = None
+        self.tasks.submit(
+            self.cache.bfs_shortest_path,
+            (start, end, True),
+            on_done=lambda result: self._show_result(start, end, result),
+            on_error=self._show_error,
+        )
+
+    def _show_result(self, start, end, result):
+        self.output.clear()
         if not result.path:
             self.output.setText(f"⚠ No path found between {start} and {end}.")
             return
@@ -266,9 +294,28 @@ class BFSWindow(QDialog):
             self.output.append(f"• {u}: {d}")
 
         self.canvas.reset_colors()
-        self.animator = BFSAnimator(self.canvas, result, self.graph)
+        self.animator = BFSAnimator(self.canvas, result, self.graph, self._frame_shown)
+        self.slider.blockSignals(True)
+        self.slider.setRange(0, self.animator.last_frame)
+        self.slider.setValue(0)
+        self.slider.blockSignals(False)
         self._update_button_states(disable_all=False)
 
+    def _show_error(self, message):
+        self.output.setText(f"⚠ BFS failed:\n{message}")
+
+    def _inputs_changed(self):
+        if self.tasks.is_busy():
+            self.tasks.cancel()
+            self.output.setText("Search cancelled (inputs changed).")
+
+    def done(self, result):
+        self.tasks.cancel()
+        if self._owns_cache:
+            # stop listening to the graph once no search uses the cache
+            self.tasks.when_idle(self.cache.close)
+        super().done(result)
+
     # Animation Controls
     def play_anim(self):
         if self.animator: self.animator.play()
@@ -283,3 +330,14 @@ class BFSWindow(QDialog):
         if self.animator:
             self.animator.restart()
             self.canvas.reset_colors()
+
+    def seek_anim(self, frame):
+        if self.animator:
+            self.animator.pause()
+            self.animator.seek(frame)
+
+    def _frame_shown(self, frame):
+        # Follow the animation without seeking again
+        self.slider.blockSignals(True)
+        self.slider.setValue(frame)
+        self.slider.blockSignals(False)
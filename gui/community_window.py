@@ -8,15 +8,21 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
-from social_graph.dsu import DSU
 from social_graph.graph import Graph
 from gui.graph_canvas import GraphCanvas
+from gui.workers import TaskRunner
+
+
+COMMUNITY_BATCH = 200   # communities sent to the UI per partial result
 
 
 class CommunityWindow(QDialog):
-    def __init__(self, graph: Graph):
+    def __init__(self, graph: Graph, tasks=None, scene=None):
         super().__init__()
         self.graph = graph
+        self.tasks = tasks or TaskRunner(self)
+        self.scene = scene    # shared GraphScene (None → canvas builds its own)
+        self._shown = 0   # communities displayed so far
 
         # Window size (more compact like BFS/DFS)
         self.setWindowTitle("🌐 Community Detection (DSU)")
@@ -74,7 +80,7 @@ class CommunityWindow(QDialog):
         left_layout.addStretch()
 
         # RIGHT PANEL — Graph Canvas
-        self.canvas = GraphCanvas(self.graph)
+        self.canvas = GraphCanvas(self.graph, scene=self.scene)
         self.canvas.setMaximumHeight(450) 
 
         root.addWidget(scroll_area, 0)
@@ -157,51 +163,70 @@ class CommunityWindow(QDialog):
     # COMMUNITY DETECTION LOGIC
     # -------------------------------------------------------
     def show_communities(self):
-        users = self.graph.get_all_users()
-        n = len(users)
-        user_to_id = {u: self.graph.get_user_id(u) for u in users}
+        # Groups are collected and sorted on the worker thread and streamed
+        # back in batches, so the first communities appear immediately.
+        self.output.clear()
+        self.output.append("⏳ Finding communities...")
+        self.canvas.reset_colors()
+        self._shown = 0
+        self.tasks.submit(
+            self._community_batches,
+            on_partial=self._show_batch,
+            on_done=self._batches_done,
+            on_error=lambda message: self.output.setText(f"⚠ Failed:\n{message}"),
+        )
+
+    def _community_batches(self):
+        # Runs on the worker thread
+        n = len(self.graph.get_all_users())
 
-        # DSU over friendships
-        dsu = DSU(n)
-        for u in users:
-            for v in self.graph.get_friends(u):
-                dsu.union(user_to_id[u], user_to_id[v])
+        # Live DSU index maintained by the graph (no per-click rebuild)
+        sorted_groups = self.graph.communities()
 
-        # Group users by root
-        communities = {}
-        for u in users:
-            root = dsu.find(user_to_id[u])
-            communities.setdefault(root, []).append(u)
+        for start in range(0, len(sorted_groups), COMMUNITY_BATCH):
+            batch = [sorted(g) for g in sorted_groups[start:start + COMMUNITY_BATCH]]
+            yield n, len(sorted_groups), batch
 
-        sorted_groups = sorted(communities.values(), key=lambda g: -len(g))
+    def _show_batch(self, item):
+        n, total, batch = item
 
         # Display info
-        self.output.clear()
-        self.output.append(f"Total Users: {n}")
-        self.output.append(f"Total Communities: {len(sorted_groups)}\n")
+        if self._shown == 0:
+            self.output.clear()
+            self.output.append(f"Total Users: {n}")
+            self.output.append(f"Total Communities: {total}\n")
 
-        for i, group in enumerate(sorted_groups, 1):
+        for i, group in enumerate(batch, self._shown + 1):
             self.output.append(f"🔸 Community {i} (size {len(group)})")
-            self.output.append("Members: " + ", ".join(sorted(group)))
+            self.output.append("Members: " + ", ".join(group))
             self.output.append("")
 
         # Color communities visually
-        self._color_communities(sorted_groups)
+        self._color_communities(batch, self._shown)
+        self._shown += len(batch)
+
+    def _batches_done(self, _result):
+        if self._shown == 0:
+            self.output.clear()
+            self.output.append("Total Users: 0")
+            self.output.append("Total Communities: 0\n")
+
+    def done(self, result):
+        self.tasks.cancel()
+        super().done(result)
 
     # -------------------------------------------------------
     # COLOR COMMUNITIES
     # -------------------------------------------------------
-    def _color_communities(self, communities):
+    def _color_communities(self, communities, first=0):
         pastel_palette = [
             QColor("#dec0ff"), QColor("#ffd6a5"), QColor("#bde0fe"),
             QColor("#ffc8dd"), QColor("#caffbf"), QColor("#a0c4ff"),
             QColor("#fdffb6"), QColor("#e4c1f9")
         ]
 
-        self.canvas.reset_colors()
-
-        for idx, group in enumerate(communities):
+        for idx, group in enumerate(communities, first):
             color = pastel_palette[idx % len(pastel_palette)]
             for username in group:
                 uid = self.graph.get_user_id(username)
-                self.canvas.nodes[uid].item.setBrush(color)
+                self.canvas.set_node_color(uid, color)
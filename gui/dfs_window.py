@@ -2,22 +2,28 @@
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QComboBox, QTextEdit,
-    QWidget, QScrollArea
+    QWidget, QScrollArea, QSlider
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
 from gui.graph_canvas import GraphCanvas
 from gui.dfs_animator import DFSAnimator
-from social_graph.dfs import dfs_shortest_path
+from gui.workers import TaskRunner
+from social_graph.cache import QueryCache
 
 
 
 class DFSWindow(QDialog):
-    def __init__(self, graph):
+    def __init__(self, graph, cache=None, tasks=None, scene=None):
         super().__init__()
 
         self.graph = graph
+        # An empty QueryCache is falsy (__len__), so test for None
+        self._owns_cache = cache is None
+        self.cache = QueryCache(graph) if cache is None else cache
+        self.tasks = tasks or TaskRunner(self)
+        self.scene = scene    # shared GraphScene (None → canvas builds its own)
         self.animator = None
 
         self.setWindowTitle("DFS Visualizer - Social Graph Explorer")
@@ -72,6 +78,10 @@ class DFSWindow(QDialog):
         self.combo_end.setMinimumHeight(36)
         left_layout.addWidget(self.combo_end)
 
+        # A search still running for the old inputs is abandoned
+        self.combo_start.currentTextChanged.connect(self._inputs_changed)
+        self.combo_end.currentTextChanged.connect(self._inputs_changed)
+
         # Run button
         self.btn_run = QPushButton("Run DFS")
         self.btn_run.setObjectName("runButton")
@@ -98,6 +108,12 @@ class DFSWindow(QDialog):
         self.btn_step.clicked.connect(self.step_anim)
         self.btn_restart.clicked.connect(self.restart_anim)
 
+        # Timeline: drag to jump to any frame of the animation
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, 0)
+        self.slider.valueChanged.connect(self.seek_anim)
+        left_layout.addWidget(self.slider)
+
         # DETAILS LABEL ----------------------------------------
         lbl_details = QLabel("Details:")
         lbl_details.setObjectName("SectionLabel")
@@ -114,7 +130,7 @@ class DFSWindow(QDialog):
 
         # RIGHT PANEL — Graph Canvas
         # ======================================================
-        self.canvas = GraphCanvas(self.graph)
+        self.canvas = GraphCanvas(self.graph, scene=self.scene)
 
         root.addWidget(scroll_area, 0)  # never expands too large
         root.addWidget(self.canvas, 1)   # canvas expands instead
@@ -192,6 +208,7 @@ class DFSWindow(QDialog):
     def _update_button_states(self, disable_all=False):
         for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart):
             b.setEnabled(not disable_all)
+        self.slider.setEnabled(not disable_all)
 
     # ---------------------------------------------------------
     # DFS LOGIC
@@ -205,11 +222,19 @@ class DFSWindow(QDialog):
             self.output.setText("⚠ Start and Target cannot be the same.")
             return
 
-        # result = dfs_traversal(self.graph, start, end, return_full_result=True)
-        result = dfs_shortest_path(self.graph, start, end, return_full_result=True)
-
-
-
+        # Search runs on the worker thread; results come back to _show_result
+        self.output.setText("⏳ Running DFS...")
+        self._update_button_states(disable_all=True)
+        self.animator = None
+        self.tasks.submit(
+            self.cache.dfs_shortest_path,
+            (start, end, True),
+            on_done=lambda result: self._show_result(start, end, result),
+            on_error=self._show_error,
+        )
+
+    def _show_result(self, start, end, result):
+        self.output.clear()
         if not result.path:
             self.output.setText(f"⚠ No path found between {start} and {end}.")
             return
@@ -222,9 +247,28 @@ class DFSWindow(QDialog):
 
 
         self.canvas.reset_colors()
-        self.animator = DFSAnimator(self.canvas, result, self.graph)
+        self.animator = DFSAnimator(self.canvas, result, self.graph, self._frame_shown)
+        self.slider.blockSignals(True)
+        self.slider.setRange(0, self.animator.last_frame)
+        self.slider.setValue(0)
+        self.slider.blockSignals(False)
         self._update_button_states(disable_all=False)
 
+    def _show_error(self, message):
+        self.output.setText(f"⚠ DFS failed:\n{message}")
+
+    def _inputs_changed(self):
+        if self.tasks.is_busy():
+            self.tasks.cancel()
+            self.output.setText("Search cancelled (inputs changed).")
+
+    def done(self, result):
+        self.tasks.cancel()
+        if self._owns_cache:
+            # stop listening to the graph once no search uses the cache
+            self.tasks.when_idle(self.cache.close)
+        super().done(result)
+
     # ---------------------------------------------------------
     # Animation Controls
     # ---------------------------------------------------------
@@ -242,4 +286,15 @@ class DFSWindow(QDialog):
             self.animator.restart()
             self.canvas.reset_colors()
 
+    def seek_anim(self, frame):
+        if self.animator:
+            self.animator.pause()
+            self.animator.seek(frame)
+
+    def _frame_shown(self, frame):
+        # Follow the animation without seeking again
+        self.slider.blockSignals(True)
+        self.slider.setValue(frame)
+        self.slider.blockSignals(False)
+
 
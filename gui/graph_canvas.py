@@ -1,10 +1,17 @@
 # gui/graph_canvas.py
 
+import math
+
 from PyQt5.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem
+    QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem,
+    QGraphicsItem, QStyleOptionGraphicsItem
 )
-from PyQt5.QtGui import QBrush, QPen, QColor, QPainter, QLinearGradient
-from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QBrush, QPen, QColor, QPainter, QLinearGradient, QPainterPath
+from PyQt5.QtCore import Qt, QPointF, QRectF, QTimer
+
+from social_graph.graph import GraphObserver
+from social_graph.layout import ForceLayout
+from .workers import TaskRunner
 
 # ---------------------------------------------------------
 # Updated color palette (Lavender Theme)
@@ -25,6 +32,22 @@ PATH_NODE = QBrush(QColor("#b1f7dd"))       # mint green (shortest path)
 NODE_RADIUS = 26
 FONT_OFFSET_Y = -6
 
+# ---------------------------------------------------------
+# Batched rendering (large graphs)
+# ---------------------------------------------------------
+BATCH_THRESHOLD = 400       # more users than this → batched layers
+GRID_CELL = 512             # spatial index cell size (scene units)
+LABEL_MIN_LOD = 0.5         # labels hidden when zoomed out beyond this
+SHAPE_MIN_LOD = 0.12        # below this, nodes are plain squares
+ZOOM_STEP = 1.15
+
+# Force-directed layout (runs in the background, see social_graph.layout)
+LAYOUT_ITERATIONS = 300
+LAYOUT_BATCH = 10           # iterations between two redraws
+LAYOUT_LARGE = 2000         # from this many users, redraw every iteration
+LAYOUT_DELAY_MS = 300       # quiet time after the last edit before relayout
+BATCH_NODE = QBrush(QColor("#f8f3ff"))      # flat fill (no per-node gradient)
+
 
 class VisualNode:
     def __init__(self, node_id, name, scene: QGraphicsScene, pos: QPointF):
@@ -75,84 +98,664 @@ class VisualEdge:
         )
 
 
-class GraphCanvas(QGraphicsView):
-    def __init__(self, graph):
+class SpatialGrid:
+    """Uniform grid over scene coordinates: cell → ids inside it."""
+
+    def __init__(self, cell: float = GRID_CELL):
+        self.cell = cell
+        self.cells = {}
+
+    def key(self, x, y):
+        return (math.floor(x / self.cell), math.floor(y / self.cell))
+
+    def insert(self, item_id, x, y):
+        self.cells.setdefault(self.key(x, y), set()).add(item_id)
+
+    def remove(self, item_id, x, y):
+        k = self.key(x, y)
+        bucket = self.cells.get(k)
+        if bucket is not None:
+            bucket.discard(item_id)
+            if not bucket:
+                del self.cells[k]
+
+    def query(self, rect: QRectF):
+        # ids in every cell overlapping rect
+        x0, y0 = self.key(rect.left(), rect.top())
+        x1, y1 = self.key(rect.right(), rect.bottom())
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.cells):
+            # zoomed far out: cheaper to walk the occupied cells
+            for (cx, cy), bucket in self.cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    yield from bucket
+            return
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield from self.cells.get((cx, cy), ())
+
+
+class NodeLayer(QGraphicsItem):
+    """
+    Every node of the canvas in one item.
+
+    paint() only visits nodes in the exposed part of the scene (found
+    through a SpatialGrid), sets each brush once for all nodes sharing
+    it, skips labels when zoomed out and draws plain squares when the
+    nodes are only a few pixels wide.
+    """
+
+    def __init__(self, names, positions):
+        super().__init__()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self.setZValue(10)
+
+        self.names = dict(names)            # uid → username
+        self.positions = dict(positions)    # uid → QPointF
+        self.brushes = {}                   # uid → QBrush (default if absent)
+        self._brush_cache = {}
+
+        self.grid = SpatialGrid()
+        for uid, p in self.positions.items():
+            self.grid.insert(uid, p.x(), p.y())
+        self._bounds = self._compute_bounds()
+
+    def _compute_bounds(self):
+        rect = QRectF()
+        for p in self.positions.values():
+            rect = rect.united(self._node_rect(p))
+        return rect
+
+    @staticmethod
+    def _node_rect(p):
+        # room for the circle, its border and the label to the right
+        return QRectF(p.x() - NODE_RADIUS - 2, p.y() - NODE_RADIUS - 2,
+                      NODE_RADIUS * 6, NODE_RADIUS * 2 + 4)
+
+    def boundingRect(self):
+        return self._bounds
+
+    # -------------------------------------------------------
+    # Colors
+    # -------------------------------------------------------
+    def set_brush(self, uid, brush):
+        if isinstance(brush, QColor):
+            # one shared QBrush per color, so paint() can group by it
+            brush = self._brush_cache.setdefault(brush.rgba(), QBrush(brush))
+        self.brushes[uid] = brush
+        self.update(self._node_rect(self.positions[uid]))
+
+    def set_brushes(self, uids, brush=None):
+        # Many nodes at once, one repaint; brush None → default fill
+        if isinstance(brush, QColor):
+            brush = self._brush_cache.setdefault(brush.rgba(), QBrush(brush))
+        rect = QRectF()
+        for uid in uids:
+            if brush is None:
+                self.brushes.pop(uid, None)
+            else:
+                self.brushes[uid] = brush
+            rect = rect.united(self._node_rect(self.positions[uid]))
+        if not rect.isNull():
+            self.update(rect)
+
+    def reset_brushes(self):
+        self.brushes.clear()
+        self.update()
+
+    # -------------------------------------------------------
+    # Nodes
+    # -------------------------------------------------------
+    def add_node(self, uid, name, pos):
+        self.prepareGeometryChange()
+        self.names[uid] = name
+        self.positions[uid] = pos
+        self.grid.insert(uid, pos.x(), pos.y())
+        self._bounds = self._bounds.united(self._node_rect(pos))
+
+    def remove_node(self, uid):
+        pos = self.positions.pop(uid, None)
+        if pos is None:
+            return
+        del self.names[uid]
+        self.brushes.pop(uid, None)
+        self.grid.remove(uid, pos.x(), pos.y())
+        self.update(self._node_rect(pos))
+
+    def move_nodes(self, moved):
+        # moved: uid → QPointF; the positions dict is updated in place
+        # (EdgeLayer shares it), then the grid and bounds are rebuilt
+        self.prepareGeometryChange()
+        self.positions.update(moved)
+        self.grid = SpatialGrid()
+        for uid, p in self.positions.items():
+            self.grid.insert(uid, p.x(), p.y())
+        self._bounds = self._compute_bounds()
+        self.update()
+
+    # -------------------------------------------------------
+    # Painting
+    # -------------------------------------------------------
+    def paint(self, painter, option, widget=None):
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        margin = NODE_RADIUS * 6
+        exposed = option.exposedRect.adjusted(-margin, -margin, margin, margin)
+        visible = list(self.grid.query(exposed))
+
+        groups = {}
+        for uid in visible:
+            brush = self.brushes.get(uid, BATCH_NODE)
+            groups.setdefault(id(brush), (brush, []))[1].append(uid)
+
+        positions = self.positions
+        r = NODE_RADIUS
+
+        if lod < SHAPE_MIN_LOD:
+            painter.setPen(Qt.NoPen)
+            for brush, uids in groups.values():
+                painter.setBrush(brush)
+                painter.drawRects([
+                    QRectF(positions[u].x() - r, positions[u].y() - r, 2 * r, 2 * r)
+                    for u in uids
+                ])
+            return
+
+        painter.setPen(QPen(NODE_BORDER, 2))
+        for brush, uids in groups.values():
+            painter.setBrush(brush)
+            for u in uids:
+                painter.drawEllipse(positions[u], r, r)
+
+        if lod >= LABEL_MIN_LOD:
+            painter.setPen(LABEL_COLOR)
+            names = self.names
+            for u in visible:
+                p = positions[u]
+                painter.drawText(QPointF(p.x() - r / 2, p.y() + 5), names[u])
+
+
+class EdgeLayer(QGraphicsItem):
+    """
+    Every edge of the canvas in one item.
+
+    Edges are bucketed by the grid cell of their midpoint and each bucket
+    is a single QPainterPath, so a repaint is one drawPath call per
+    visible bucket instead of one item per edge. The pen is cosmetic (a
+    constant pixel width), which keeps zoomed-out views cheap.
+    """
+
+    def __init__(self, positions, edges):
         super().__init__()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self.setZValue(0)
+
+        self.positions = positions          # uid → QPointF (shared)
+        self.pen = QPen(EDGE_COLOR, 2)
+        self.pen.setCosmetic(True)
+        self.grid = SpatialGrid()
+        self._buckets = {}                  # cell → [edges, path, bounds]
+        self._bounds = QRectF()
+
+        self._fill(edges)
+
+    def _fill(self, edges):
+        for uid, vid in edges:
+            self._bucket(uid, vid)[0].add((uid, vid))
+        for cell in list(self._buckets):
+            self._rebuild(cell)
+
+    def _cell(self, uid, vid):
+        p, q = self.positions[uid], self.positions[vid]
+        return self.grid.key((p.x() + q.x()) / 2, (p.y() + q.y()) / 2)
+
+    def _bucket(self, uid, vid):
+        return self._buckets.setdefault(self._cell(uid, vid), [set(), None, None])
+
+    def _rebuild(self, cell):
+        edges, _, old_bounds = self._buckets[cell]
+        if not edges:
+            del self._buckets[cell]
+            if old_bounds is not None:
+                self.update(old_bounds)
+            return
+        path = QPainterPath()
+        positions = self.positions
+        for uid, vid in edges:
+            path.moveTo(positions[uid])
+            path.lineTo(positions[vid])
+        bounds = path.boundingRect().adjusted(-2, -2, 2, 2)
+        self._buckets[cell][1:] = [path, bounds]
+
+        self.prepareGeometryChange()
+        self._bounds = self._bounds.united(bounds)
+        self.update(bounds if old_bounds is None else bounds.united(old_bounds))
+
+    def boundingRect(self):
+        return self._bounds
+
+    def add_edge(self, uid, vid):
+        cell = self._cell(uid, vid)
+        self._bucket(uid, vid)[0].add((uid, vid))
+        self._rebuild(cell)
+
+    def relayout(self):
+        # Nodes moved: re-bucket every edge
+        edges = [e for bucket in self._buckets.values() for e in bucket[0]]
+        self.prepareGeometryChange()
+        self._buckets = {}
+        self._bounds = QRectF()
+        self._fill(edges)
+        self.update()
+
+    def remove_edge(self, uid, vid):
+        cell = self._cell(uid, vid)
+        bucket = self._buckets.get(cell)
+        if bucket is None:
+            return
+        bucket[0].discard((uid, vid))
+        bucket[0].discard((vid, uid))
+        self._rebuild(cell)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        painter.setPen(self.pen)
+        painter.setBrush(Qt.NoBrush)
+        for _, path, bounds in self._buckets.values():
+            if bounds.intersects(exposed):
+                painter.drawPath(path)
+
+
+class GraphScene(QGraphicsScene, GraphObserver):
+    """
+    Scene model of one Graph, shared by any number of GraphCanvas views.
+
+    The scene observes the graph (Graph.add_listener) and applies each
+    change as a diff: adding or removing a user touches one node, and
+    adding or removing a friendship touches one edge. An edit is therefore
+    O(degree) on screen instead of a full rebuild. Only a graph_reset
+    (load/compact/bulk load renumbering ids) rebuilds everything.
+
+    The scene keeps observing while no view shows it (diffs are cheap);
+    only the layout waits until a view is visible again. detach() stops
+    observing altogether; a later attach() rebuilds if the graph changed
+    in between.
+    """
+
+    def __init__(self, graph, batched=None):
+        QGraphicsScene.__init__(self)
         self.graph = graph
 
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setRenderHint(QPainter.Antialiasing)
+        # Batched layers for large graphs (one item per layer instead of
+        # several items per user and edge); None → decide by graph size
+        if batched is None:
+            batched = len(graph.get_all_users()) > BATCH_THRESHOLD
+        self.batched = batched
+        if batched:
+            self.setItemIndexMethod(QGraphicsScene.NoIndex)
+
+        self.nodes = {}          # uid → VisualNode (item mode)
+        self.edges = {}          # (uid, vid), uid < vid → VisualEdge
+        self.ids = {}            # username → uid shown for it
+        self.bounds = QRectF()   # running bound of the node positions
+        self.node_layer = None
+        self.edge_layer = None
+
+        # Layout runs on its own worker so window searches never cancel it
+        self.layout_tasks = TaskRunner(self)
+        self._needs_layout = False
+        # Edits only (re)arm this timer; a burst of edits starts one
+        # layout (one freeze of the graph) once it has been quiet
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(LAYOUT_DELAY_MS)
+        self._layout_timer.timeout.connect(self.resume_layout)
+        self._attached = False
+        self._version = None
 
-        # ✨ Canvas theme
-        self.setStyleSheet("""
-            QGraphicsView {
-                background-color: #f3eaff;
-                border: 3px solid #d3c5ff;
-                border-radius: 18px;
-            }
-        """)
+        self._build_graph()
+        self.attach()
 
+    # ---------------------------------------------------------
+    # Observing the graph
+    # ---------------------------------------------------------
+    def attach(self):
+        if self._attached:
+            return
+        self._attached = True
+        self.graph.add_listener(self)
+        if self._version is not None and self._version != self.graph.version:
+            self.graph_reset()
+
+    def detach(self):
+        if not self._attached:
+            return
+        self._attached = False
+        self.graph.remove_listener(self)
+        self.pause_layout()
+        self._version = self.graph.version
+
+    def user_added(self, username):
+        uid = self.graph.get_user_id(username)
+        pos = self.graph.get_position(username)
+        if pos is None:
+            # until the layout places it: next to the current centre
+            center = self.bounds.center()
+            pos = (center.x(), center.y())
+            self._needs_layout = True
+        point = QPointF(*pos)
+        self.bounds = self.bounds.united(QRectF(point, point))
+
+        self.ids[username] = uid
+        if self.batched:
+            self.node_layer.add_node(uid, username, point)
+        else:
+            self.nodes[uid] = VisualNode(uid, username, self, point)
+        self._layout_soon()
+
+    def user_removed(self, username):
+        uid = self.ids.pop(username, None)
+        if uid is None:
+            return
+        if self.batched:
+            self.node_layer.remove_node(uid)
+            return
+        node = self.nodes.pop(uid)
+        self.removeItem(node.item)
+        self.removeItem(node.label)
+
+    def friendship_added(self, u, v):
+        uid, vid = self.ids[u], self.ids[v]
+        if self.batched:
+            self.edge_layer.add_edge(uid, vid)
+        else:
+            key = (min(uid, vid), max(uid, vid))
+            self.edges[key] = VisualEdge(self.nodes[key[0]], self.nodes[key[1]], self)
+        # a new friendship pulls the two users together
+        self._needs_layout = True
+        self._layout_soon()
+
+    def friendship_removed(self, u, v):
+        uid, vid = self.ids[u], self.ids[v]
+        if self.batched:
+            self.edge_layer.remove_edge(uid, vid)
+            return
+        edge = self.edges.pop((min(uid, vid), max(uid, vid)), None)
+        if edge is not None:
+            self.removeItem(edge.item)
+
+    def graph_reset(self):
+        self.layout_tasks.cancel()
+        self.clear()
         self.nodes = {}
-        self.edges = []
-
+        self.edges = {}
+        self.ids = {}
+        self.node_layer = None
+        self.edge_layer = None
         self._build_graph()
+        self._layout_soon()
+
+    def _layout_soon(self):
+        # Warm-start the layout after edits (restarts a running one);
+        # O(1) per edit, without a visible view it waits for resume_layout()
+        if self._needs_layout and self._visible():
+            self._layout_timer.start()
+
+    def _visible(self):
+        return any(view.isVisible() for view in self.views())
 
     # ---------------------------------------------------------
     # Build graph visually
     # ---------------------------------------------------------
-    def _build_graph(self):
+    def _layout(self):
+        # Positions saved with the graph by an earlier layout run; users
+        # without one start on a circle until the force layout places them
+        stored = self.graph.get_positions()
         users = sorted(self.graph.get_all_users())
         center_x, center_y = 400, 300
         radius = 220
 
-        import math
         n = len(users)
+        if self.batched:
+            # keep neighbouring nodes apart on large circles
+            radius = max(radius, n * NODE_RADIUS * 3 / (2 * math.pi))
 
+        positions = {}
         for i, name in enumerate(users):
-            angle = (2 * math.pi * i) / max(1, n)
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
+            if name in stored:
+                x, y = stored[name]
+            else:
+                angle = (2 * math.pi * i) / max(1, n)
+                x = center_x + radius * math.cos(angle)
+                y = center_y + radius * math.sin(angle)
+                self._needs_layout = True
+            positions[self.graph.get_user_id(name)] = QPointF(x, y)
+        return positions
+
+    def _build_graph(self):
+        positions = self._layout()
+        self.ids = {self.graph.get_user_name(uid): uid for uid in positions}
+        self.bounds = self._bounds_of(positions.values())
 
-            uid = self.graph.get_user_id(name)
-            node = VisualNode(uid, name, self.scene, QPointF(x, y))
+        if self.batched:
+            self._build_layers(positions)
+            return
+
+        for uid, pos in positions.items():
+            node = VisualNode(uid, self.graph.get_user_name(uid), self, pos)
             self.nodes[uid] = node
 
         # Create edges
         for uid in self.nodes:
             for vid in self.graph.get_neighbors(uid):
                 if uid < vid:  # avoid duplicates
-                    self.edges.append(
-                        VisualEdge(self.nodes[uid], self.nodes[vid], self.scene)
-                    )
+                    self.edges[(uid, vid)] = VisualEdge(self.nodes[uid], self.nodes[vid], self)
+
+    def _build_layers(self, positions):
+        names = {uid: self.graph.get_user_name(uid) for uid in positions}
+        self.node_layer = NodeLayer(names, positions)
+        edges = (
+            (uid, vid)
+            for uid in positions
+            for vid in self.graph.get_neighbors(uid)
+            if uid < vid
+        )
+        self.edge_layer = EdgeLayer(self.node_layer.positions, edges)
+        self.addItem(self.edge_layer)
+        self.addItem(self.node_layer)
+
+    @staticmethod
+    def _bounds_of(points):
+        points = list(points)
+        xs = [p.x() for p in points]
+        ys = [p.y() for p in points]
+        if not xs:
+            return QRectF()
+        return QRectF(QPointF(min(xs), min(ys)), QPointF(max(xs), max(ys)))
+
+    # ---------------------------------------------------------
+    # Force-directed layout
+    # ---------------------------------------------------------
+    def resume_layout(self):
+        if self._needs_layout and self._attached:
+            self.start_layout()
+
+    def pause_layout(self):
+        # An interrupted layout continues on the next resume_layout()
+        if self.layout_tasks.is_busy():
+            self._needs_layout = True
+        self._layout_timer.stop()
+        self.layout_tasks.cancel()
+
+    def start_layout(self):
+        # Warm start from the stored positions; every LAYOUT_BATCH
+        # iterations the new positions are stored and drawn. The worker
+        # only sees a frozen CSR snapshot: the Graph itself is not
+        # thread-safe and may be edited while the layout runs.
+        self._needs_layout = False
+        self._layout_timer.stop()
+        self.layout_tasks.submit(
+            self._run_layout,
+            (self.graph.freeze(), self.graph.get_positions()),
+            on_partial=self._positions_ready,
+            on_done=lambda _result: self._fit_views(),
+        )
+
+    @staticmethod
+    def _run_layout(snapshot, positions):
+        # Runs on the layout worker thread
+        layout = ForceLayout(snapshot, positions)
+        batch = 1 if len(layout.names) >= LAYOUT_LARGE else LAYOUT_BATCH
+        yield from layout.iter_steps(LAYOUT_ITERATIONS, batch)
+
+    def _positions_ready(self, positions):
+        self.graph.set_positions(positions)
+        self.apply_positions(positions)
+
+    def _fit_views(self):
+        for view in self.views():
+            view.fit_graph()
+
+    def apply_positions(self, positions):
+        # positions: username → (x, y); users not in it stay where they are
+        moved = {}
+        for name, (x, y) in positions.items():
+            uid = self.ids.get(name)
+            if uid is not None:
+                moved[uid] = QPointF(x, y)
+
+        if self.batched:
+            self.node_layer.move_nodes(moved)
+            self.edge_layer.relayout()
+            self.bounds = self._bounds_of(self.node_layer.positions.values())
+            return
+
+        for uid, pos in moved.items():
+            node = self.nodes[uid]
+            node.pos = pos
+            node.item.setPos(pos)
+            node.label.setPos(pos.x() - NODE_RADIUS / 2, pos.y() + FONT_OFFSET_Y)
+        for edge in self.edges.values():
+            edge.update()
+        self.bounds = self._bounds_of(node.pos for node in self.nodes.values())
 
     # ---------------------------------------------------------
     # Color helpers used by BFS / DFS
     # ---------------------------------------------------------
     def reset_colors(self):
+        if self.batched:
+            self.node_layer.reset_brushes()
+            return
+
+        brush = self._default_brush()
         for node in self.nodes.values():
+            node.item.setBrush(brush)
 
-            gradient = QLinearGradient(0, -NODE_RADIUS, 0, NODE_RADIUS)
-            gradient.setColorAt(0, QColor("#ffffff"))
-            gradient.setColorAt(1, QColor("#f1e8ff"))
-            node.item.setBrush(QBrush(gradient))
+    @staticmethod
+    def _default_brush():
+        gradient = QLinearGradient(0, -NODE_RADIUS, 0, NODE_RADIUS)
+        gradient.setColorAt(0, QColor("#ffffff"))
+        gradient.setColorAt(1, QColor("#f1e8ff"))
+        return QBrush(gradient)
+
+    def set_node_color(self, uid, brush):
+        # brush: QBrush or QColor; works in both rendering modes
+        if self.batched:
+            self.node_layer.set_brush(uid, brush)
+        else:
+            self.nodes[uid].item.setBrush(brush)
+
+    def set_node_colors(self, uids, brush=None):
+        # One color for many nodes (brush None → default); in batched
+        # mode this is a single repaint of the affected area
+        if self.batched:
+            self.node_layer.set_brushes(uids, brush)
+            return
+        if brush is None:
+            brush = self._default_brush()
+        for uid in uids:
+            self.nodes[uid].item.setBrush(brush)
 
-    def mark_visited(self, uid):
-        self.nodes[uid].item.setBrush(VISITED_NODE)
 
-    def mark_frontier(self, uid):
-        self.nodes[uid].item.setBrush(FRONTIER_NODE)
+class GraphCanvas(QGraphicsView):
+    def __init__(self, graph, batched=None, scene=None):
+        super().__init__()
+        self.graph = graph
+
+        # One GraphScene can back several canvases (pass scene=...); its
+        # owner keeps it. A canvas without one builds a private scene.
+        self._owns_scene = scene is None
+        if scene is None:
+            scene = GraphScene(graph, batched)
+        else:
+            scene.attach()
+            scene.reset_colors()
+        self.scene = scene
+        self.setScene(scene)
+        self.batched = scene.batched
+        self.setRenderHint(QPainter.Antialiasing, not self.batched)
+
+        # Pan by dragging, zoom with the wheel around the cursor
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+
+        # ✨ Canvas theme
+        self.setStyleSheet("""
+            QGraphicsView {
+                background-color: #f3eaff;
+                border: 3px solid #d3c5ff;
+                border-radius: 18px;
+            }
+        """)
+
+    # Items live in the shared scene model
+    @property
+    def nodes(self):
+        return self.scene.nodes
+
+    @property
+    def edges(self):
+        return self.scene.edges
+
+    def wheelEvent(self, event):
+        factor = ZOOM_STEP if event.angleDelta().y() > 0 else 1 / ZOOM_STEP
+        self.scale(factor, factor)
+
+    def showEvent(self, event):
+        self.scene.attach()
+        self.scene.resume_layout()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Last visible view closed: a shared scene keeps following the
+        # graph but pauses its layout; a private one stops observing
+        if not any(v is not self and v.isVisible() for v in self.scene.views()):
+            if self._owns_scene:
+                self.scene.detach()
+            else:
+                self.scene.pause_layout()
+        super().hideEvent(event)
+
+    def fit_graph(self):
+        rect = self.scene.itemsBoundingRect()
+        if not rect.isEmpty():
+            self.fitInView(rect.adjusted(-40, -40, 40, 40), Qt.KeepAspectRatio)
 
-    def mark_path(self, uid):
-        self.nodes[uid].item.setBrush(PATH_NODE)
     # ---------------------------------------------------------
-    # DELETE USER
+    # Color helpers used by BFS / DFS
     # ---------------------------------------------------------
-    def delete_user_visual(self, username: str):
-        # 1. Clear scene and internal structures
-        self.scene.clear()
-        self.nodes = {}
-        self.edges = []
+    def reset_colors(self):
+        self.scene.reset_colors()
 
-        # 2. Rebuild the graph
-        self._build_graph()
+    def set_node_color(self, uid, brush):
+        self.scene.set_node_color(uid, brush)
+
+    def set_node_colors(self, uids, brush=None):
+        self.scene.set_node_colors(uids, brush)
+
+    def mark_visited(self, uid):
+        self.set_node_color(uid, VISITED_NODE)
+
+    def mark_frontier(self, uid):
+        self.set_node_color(uid, FRONTIER_NODE)
+
+    def mark_path(self, uid):
+        self.set_node_color(uid, PATH_NODE)
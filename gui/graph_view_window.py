@@ -285,7 +285,7 @@ class GraphViewWindow(QDialog):
 
         # Perform deletion in backend
         self.graph.delete_user(username)
-        self.graph.save()
+        self.graph.sync()
         self._refresh_tabs()
         # Refresh graph preview — adjacency list & matrix
         # (Tabs will rebuild when reopened)
@@ -9,13 +9,22 @@ from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
 from gui.graph_canvas import GraphCanvas
-from social_graph.bfs import bfs_shortest_path
+from gui.workers import TaskRunner
+from social_graph.cache import QueryCache
+
+
+MAX_RECOMMENDATIONS = 10
 
 
 class RecommendationWindow(QDialog):
-    def __init__(self, graph):
+    def __init__(self, graph, cache=None, tasks=None, scene=None):
         super().__init__()
         self.graph = graph
+        # An empty QueryCache is falsy (__len__), so test for None
+        self._owns_cache = cache is None
+        self.cache = QueryCache(graph) if cache is None else cache
+        self.tasks = tasks or TaskRunner(self)
+        self.scene = scene    # shared GraphScene (None → canvas builds its own)
 
         self.setWindowTitle("⭐ Friend Recommendations")
         self.resize(980, 540)          # smaller overall window
@@ -63,6 +72,7 @@ class RecommendationWindow(QDialog):
         self.combo_user.setMinimumHeight(30)
         self.combo_user.setStyleSheet("font-size: 13px;")
         self.combo_user.addItems(sorted(self.graph.get_all_users()))
+        self.combo_user.currentTextChanged.connect(self._inputs_changed)
         left_layout.addWidget(self.combo_user)
 
         # Generate Button
@@ -88,7 +98,7 @@ class RecommendationWindow(QDialog):
         # -------------------------------------------------------
         # RIGHT CANVAS
         # -------------------------------------------------------
-        self.canvas = GraphCanvas(self.graph)
+        self.canvas = GraphCanvas(self.graph, scene=self.scene)
         self.canvas.setMaximumHeight(480)  # slightly shorter right panel
 
         root.addWidget(scroll_area, 0)
@@ -171,8 +181,16 @@ class RecommendationWindow(QDialog):
             self.output.setText("Please select a user.")
             return
 
-        recommendations = self.get_recommendations(username)
+        # Ranking runs on the worker thread; results come back to _show_result
+        self.output.setText("⏳ Ranking candidates...")
+        self.tasks.submit(
+            self.get_recommendations,
+            (username,),
+            on_done=lambda recommendations: self._show_result(username, recommendations),
+            on_error=lambda message: self.output.setText(f"⚠ Failed:\n{message}"),
+        )
 
+    def _show_result(self, username, recommendations):
         self.output.clear()
         self.output.append(f"Recommendations for {username}:\n")
 
@@ -188,25 +206,22 @@ class RecommendationWindow(QDialog):
 
         self.highlight_recommendations([rec[0] for rec in recommendations])
 
-    # Ranking system (unchanged)
-    def get_recommendations(self, user):
-        all_users = set(self.graph.get_all_users())
-        friends = set(self.graph.get_friends(user))
-        candidates = all_users - friends - {user}
-
-        recommendations = []
-
-        for other in candidates:
-            mutual_count = len(friends.intersection(self.graph.get_friends(other)))
-            bfs_res = bfs_shortest_path(self.graph, user, other, return_full_result=True)
-            distance = bfs_res.distances.get(other, None)
-            distance_score = 0 if distance is None else 1 / (1 + distance)
+    def _inputs_changed(self):
+        if self.tasks.is_busy():
+            self.tasks.cancel()
+            self.output.clear()
 
-            final_score = (mutual_count * 0.7) + (distance_score * 0.3)
-            recommendations.append((other, final_score, mutual_count, distance))
+    def done(self, result):
+        self.tasks.cancel()
+        if self._owns_cache:
+            # stop listening to the graph once no search uses the cache
+            self.tasks.when_idle(self.cache.close)
+        super().done(result)
 
-        recommendations.sort(key=lambda x: -x[1])
-        return recommendations
+    # Ranking system (single BFS + heap, see social_graph.recommendation),
+    # reused from the cache while the graph is unchanged
+    def get_recommendations(self, user):
+        return self.cache.rank_recommendations(user, max_results=MAX_RECOMMENDATIONS)
 
     # Highlight recommended users
     def highlight_recommendations(self, recommended_users):
@@ -214,4 +229,4 @@ class RecommendationWindow(QDialog):
         rec_color = QColor("#b8f5c4")
         for u in recommended_users:
             uid = self.graph.get_user_id(u)
-            self.canvas.nodes[uid].item.setBrush(rec_color)
+            self.canvas.set_node_color(uid, rec_color)
@@ -0,0 +1,163 @@
+# gui/workers.py
+
+import inspect
+import threading
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskSignals(QObject):
+    # Created on the UI thread, so slots connected to these run there
+    # (queued connection) even though the task emits from a worker.
+    partial = pyqtSignal(object)    # one item yielded by a generator task
+    finished = pyqtSignal(object)   # final result
+    failed = pyqtSignal(str)
+    done = pyqtSignal()             # always last, even when cancelled
+
+
+class Task(QRunnable):
+    """
+    Runs fn(*args) on a pool thread.
+
+    If fn returns a generator, every yielded item is sent as a partial
+    result and the generator's return value is the final one. Python
+    threads cannot be interrupted, so cancel() is cooperative: generator
+    tasks stop at their next yield, plain calls finish but emit nothing.
+    """
+
+    def __init__(self, fn, args=()):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = TaskSignals()
+        self._cancelled = threading.Event()
+        # Python keeps ownership, so a cancelled task can still be referenced
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+            if inspect.isgenerator(result):
+                result = self._drain(result)
+        except Exception:
+            if not self.is_cancelled():
+                self.signals.failed.emit(traceback.format_exc(limit=3))
+        else:
+            if not self.is_cancelled():
+                self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
+
+    def _drain(self, gen):
+        while True:
+            if self.is_cancelled():
+                gen.close()
+                return None
+            try:
+                item = next(gen)
+            except StopIteration as stop:
+                return stop.value
+            self.signals.partial.emit(item)
+
+
+class TaskRunner(QObject):
+    """
+    Runs social_graph calls off the Qt event loop, one at a time.
+
+    submit() cancels whatever was running or queued before it, and only
+    the latest task's callbacks are ever invoked, so a slow result that
+    arrives after the user changed the inputs is dropped. Tasks share a
+    single worker thread: the Graph and QueryCache are not thread-safe,
+    and this keeps every query serialized without locks.
+
+    Pure-Python algorithms still hold the GIL while they run; the
+    interpreter hands it back every few milliseconds, which is enough
+    for the event loop to keep repainting.
+
+    A cancelled plain call still runs to the end on the worker. Code
+    that must not overlap with it (graph edits) uses when_idle() instead
+    of blocking the event loop in wait().
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._current = None
+        self._alive = set()   # started tasks, referenced until they are done
+        self._idle_callbacks = []
+
+    def submit(self, fn, args=(), on_done=None, on_partial=None, on_error=None) -> Task:
+        self.cancel()
+
+        task = Task(fn, args)
+        if on_done is not None:
+            task.signals.finished.connect(self._guard(task, on_done))
+        if on_partial is not None:
+            task.signals.partial.connect(self._guard(task, on_partial))
+        if on_error is not None:
+            task.signals.failed.connect(self._guard(task, on_error))
+        task.signals.done.connect(lambda t=task: self._release(t))
+
+        self._current = task
+        self._alive.add(task)
+        self.pool.start(task)
+        return task
+
+    def _guard(self, task, callback):
+        # Drop signals of tasks that were cancelled or replaced
+        def deliver(value):
+            if task is self._current and not task.is_cancelled():
+                callback(value)
+        return deliver
+
+    def _release(self, task):
+        self._alive.discard(task)
+        if task is self._current:
+            self._current = None
+        if not self._alive:
+            self._run_idle_callbacks()
+
+    def _run_idle_callbacks(self):
+        callbacks, self._idle_callbacks = self._idle_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def cancel(self):
+        task, self._current = self._current, None
+        if task is not None:
+            task.cancel()
+            if self.pool.tryTake(task):   # not started yet → never runs
+                self._alive.discard(task)
+                if not self._alive:
+                    self._run_idle_callbacks()
+
+    def is_busy(self) -> bool:
+        return self._current is not None
+
+    def is_idle(self) -> bool:
+        # No task running or queued, cancelled ones included
+        return not self._alive
+
+    def when_idle(self, callback):
+        """
+        Call callback (on the UI thread) once no task is running: right
+        away if the worker is idle, else when the last one finishes. A
+        plain search cannot be interrupted, so this is how to wait for a
+        cancelled one without blocking the event loop.
+        """
+        if self.is_idle():
+            callback()
+        else:
+            self._idle_callbacks.append(callback)
+
+    def wait(self):
+        # Block until the worker is idle; only for shutdown, see when_idle
+        self.pool.waitForDone()
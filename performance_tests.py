@@ -1,9 +1,12 @@
 # performance_tests.py
 
 from social_graph.graph import Graph
-from social_graph.bfs import bfs_shortest_path
+from social_graph.bfs import bfs_shortest_path, bfs_multi_source, bfs_distances
+from social_graph.dfs import dfs_traversal, DFSResult
 from social_graph.dfs_iterative import dfs_iterative
+from social_graph.parallel import distance_histograms
 
+import sys
 from time import perf_counter
 from random import randint, choice
 
@@ -26,6 +29,45 @@ def build_graph(n_users: int, edge_density: float = 0.01) -> Graph:
     return g
 
 
+def dfs_traversal_recursive(g: Graph, start_user: str):
+    # Reference: the original recursive dfs_traversal, kept for comparison
+    start_id = g.get_user_id(start_user)
+    sorted_neighbors = g.sorted_neighbors
+
+    visited = set()
+    parent = {start_id: None}
+    depth = {}
+    order_ids = []
+    tin, tout = {}, {}
+    timer = [1]
+
+    def dfs(u, d):
+        visited.add(u)
+        depth[u] = d
+        order_ids.append(u)
+        tin[u] = timer[0]
+        timer[0] += 1
+
+        for v in sorted_neighbors(u):
+            if v not in visited:
+                parent[v] = u
+                dfs(v, d + 1)
+
+        tout[u] = timer[0]
+        timer[0] += 1
+
+    dfs(start_id, 0)
+
+    get_name = g.get_user_name
+    return DFSResult(
+        [get_name(n) for n in order_ids],
+        {get_name(k): (None if v is None else get_name(v)) for k, v in parent.items()},
+        {get_name(k): v for k, v in depth.items()},
+        {get_name(k): v for k, v in tin.items()},
+        {get_name(k): v for k, v in tout.items()},
+    )
+
+
 def measure_avg_time(func, runs=3):
     total = 0
     for _ in range(runs):
@@ -42,12 +84,82 @@ def test_bfs(g: Graph):
     bfs_shortest_path(g, start, end, return_full_result=True)
 
 
+def test_bfs_unordered(g: Graph):
+    users = g.get_all_users()
+    start = choice(users)
+    end = choice(users)
+    bfs_shortest_path(g, start, end, return_full_result=True, deterministic=False)
+
+
 def test_dfs(g: Graph):
     users = g.get_all_users()
     start = choice(users)
     dfs_iterative(g, start)
 
 
+def measure_best_time(func, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        t0 = perf_counter()
+        func()
+        best = min(best, perf_counter() - t0)
+    return best * 1000   # ms
+
+
+def run_dfs_traversal_benchmark():
+    # Recursive vs explicit-stack dfs_traversal on a random graph.
+    # The recursion limit is raised temporarily so the baseline can run;
+    # best-of-5 timings to keep the comparison stable.
+    print("\n===== DFS TRAVERSAL: RECURSIVE vs EXPLICIT STACK =====\n")
+
+    for size in [1000, 5000, 10000]:
+        g = build_graph(size, edge_density=4 / size)
+        start = choice(g.get_all_users())
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, size + 100))
+        try:
+            rec_time = measure_best_time(lambda: dfs_traversal_recursive(g, start))
+        finally:
+            sys.setrecursionlimit(limit)
+        stack_time = measure_best_time(lambda: dfs_traversal(g, start))
+
+        print(f"N = {size}: recursive {rec_time:.4f} ms | explicit stack {stack_time:.4f} ms")
+
+
+def run_whole_graph_bfs_benchmark():
+    # Single-source all-distances: queue-based BFS vs direction-optimizing
+    # BFS on a CSR snapshot (snapshot built once, outside the timing).
+    print("\n===== WHOLE-GRAPH BFS: QUEUE vs DIRECTION-OPTIMIZING =====\n")
+
+    for size in [1000, 5000, 10000]:
+        g = build_graph(size)
+        csr = g.freeze()
+        start = choice(g.get_all_users())
+
+        queue_time = measure_best_time(
+            lambda: bfs_multi_source(g, [start], deterministic=False)
+        )
+        diropt_time = measure_best_time(lambda: bfs_distances(csr, start))
+
+        print(f"N = {size}: queue BFS {queue_time:.4f} ms | direction-optimizing {diropt_time:.4f} ms")
+
+
+def run_parallel_distance_benchmark():
+    # Distance histograms from every user: one process vs a process pool
+    # over a shared-memory CSR snapshot.
+    print("\n===== ALL-SOURCE DISTANCES: 1 PROCESS vs PROCESS POOL =====\n")
+
+    for size in [1000, 5000]:
+        g = build_graph(size)
+
+        serial = distance_histograms(g, workers=1)
+        pooled = distance_histograms(g)
+
+        print(f"N = {size}: 1 process {serial.time_ms:.1f} ms | pool {pooled.time_ms:.1f} ms"
+              f" | avg separation {pooled.average_separation:.3f}")
+
+
 def run_benchmarks():
     sizes = [1000, 5000, 10000] 
 
@@ -61,11 +173,16 @@ def run_benchmarks():
         g = build_graph(size)
 
         bfs_time = measure_avg_time(lambda: test_bfs(g))
+        bfs_fast_time = measure_avg_time(lambda: test_bfs_unordered(g))
         dfs_time = measure_avg_time(lambda: test_dfs(g))
 
         print(f"Average BFS time: {bfs_time:.4f} ms")
+        print(f"Average BFS time (deterministic=False): {bfs_fast_time:.4f} ms")
         print(f"Average DFS time: {dfs_time:.4f} ms")
 
 
 if __name__ == "__main__":
-    run_benchmarks()
\ No newline at end of file
+    run_benchmarks()
+    run_dfs_traversal_benchmark()
+    run_whole_graph_bfs_benchmark()
+    run_parallel_distance_benchmark()
@@ -1,13 +1,33 @@
+from array import array
 from collections import deque
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from time import perf_counter
+from .csr import CSRGraph
 from .graph import Graph
 
 
 # =====================================================================
-# Result Container (unchanged)
+# Result Container
 # =====================================================================
 class BFSResult:
+    """
+    BFS outcome. Internally it keeps the id-based search state
+    (expansion order, distances, parent pointers); the name-keyed views
+    visited_order, distances and exploration_tree are only built the
+    first time they are read, so path-only callers never pay for them.
+
+    Ids are resolved through the graph's name table as it was when the
+    search ran (Graph.name_table), so the views stay correct even if
+    users are deleted, ids reused or the graph compacted before they are
+    first read.
+    """
+
+    __slots__ = (
+        "path", "time_ms", "reachable",
+        "_get_name", "_order_ids", "_dist_ids", "_parent_ids",
+        "_visited_order", "_distances", "_exploration_tree",
+    )
+
     def __init__(
         self,
         path: List[str],
@@ -18,11 +38,55 @@ class BFSResult:
         reachable: bool = True,
     ):
         self.path = path
-        self.visited_order = visited_order
-        self.distances = distances
-        self.exploration_tree = exploration_tree
         self.time_ms = time_ms
         self.reachable = reachable  # False = no possible path
+        self._get_name = None
+        self._order_ids = self._dist_ids = self._parent_ids = None
+        self._visited_order = visited_order
+        self._distances = distances
+        self._exploration_tree = exploration_tree
+
+    @classmethod
+    def from_ids(
+        cls,
+        get_name,
+        path: List[str],
+        order_ids: List[int],
+        dist_ids: Dict[int, int],
+        parent_ids: Dict[int, Optional[int]],
+        time_ms: float = 0.0,
+        reachable: bool = True,
+    ) -> "BFSResult":
+        result = cls(path, None, None, None, time_ms, reachable)
+        result._get_name = get_name
+        result._order_ids = order_ids
+        result._dist_ids = dist_ids
+        result._parent_ids = parent_ids
+        return result
+
+    @property
+    def visited_order(self) -> List[str]:
+        if self._visited_order is None:
+            get_name = self._get_name
+            self._visited_order = [get_name(n) for n in self._order_ids]
+        return self._visited_order
+
+    @property
+    def distances(self) -> Dict[str, int]:
+        if self._distances is None:
+            get_name = self._get_name
+            self._distances = {get_name(n): d for n, d in self._dist_ids.items()}
+        return self._distances
+
+    @property
+    def exploration_tree(self) -> Dict[str, Optional[str]]:
+        if self._exploration_tree is None:
+            get_name = self._get_name
+            self._exploration_tree = {
+                get_name(n): (None if p is None else get_name(p))
+                for n, p in self._parent_ids.items()
+            }
+        return self._exploration_tree
 
     def to_dict(self) -> Dict[str, Any]:
         #Convert result to JSON-friendly dict.
@@ -40,10 +104,12 @@ class BFSResult:
 # MAIN BFS FUNCTION
 # =====================================================================
 def bfs_shortest_path(
-    graph: Graph,
+    graph: Graph | CSRGraph,
     start_user: str,
     target_user: str,
     return_full_result: bool = True,
+    bidirectional: bool = False,
+    deterministic: bool = True,
 ) -> BFSResult | List[str]:
     """
     Compute the BFS-based shortest path between two users.
@@ -53,6 +119,12 @@ def bfs_shortest_path(
         start_user      : starting username
         target_user     : destination username
         return_full_result : True → BFSResult, False → path only
+        bidirectional   : search from both ends and meet in the middle.
+                          visited_order then lists nodes expanded by
+                          either search; distances and exploration_tree
+                          describe the forward search plus the path.
+        deterministic   : False skips username ordering of neighbors;
+                          still a shortest path, but ties may differ.
 
     Returns:
         BFSResult or List[str] (path only)
@@ -89,14 +161,19 @@ def bfs_shortest_path(
     start_id = graph.get_user_id(start_user)
     target_id = graph.get_user_id(target_user)
 
+    if bidirectional:
+        return _bidirectional_bfs(
+            graph, start_id, target_id, start_time, return_full_result,
+            deterministic,
+        )
+
     queue = deque([start_id])
-    visited = {start_id}
-    parent: Dict[int, Optional[int]] = {start_id: None}
+    parent: Dict[int, Optional[int]] = {start_id: None}   # doubles as visited
     distances: Dict[int, int] = {start_id: 0}
     visited_order_ids: List[int] = []
 
     # Faster local bindings
-    get_neighbors = graph.get_neighbors
+    neighbors_of = graph.sorted_neighbors if deterministic else graph.iter_neighbors
     get_name = graph.get_user_name
 
     # --------------------------------------------------------
@@ -109,12 +186,9 @@ def bfs_shortest_path(
         if current == target_id:
             break
 
-        # Deterministic sorted neighbors
-        neighbors = sorted(get_neighbors(current), key=get_name)
-
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                visited.add(neighbor)
+        # Deterministic sorted neighbors (unless disabled)
+        for neighbor in neighbors_of(current):
+            if neighbor not in parent:
                 parent[neighbor] = current
                 distances[neighbor] = distances[current] + 1
                 queue.append(neighbor)
@@ -123,26 +197,22 @@ def bfs_shortest_path(
     # Build results
     # --------------------------------------------------------
     path = _reconstruct_path(parent, target_id, get_name)
-    visited_order = [get_name(n) for n in visited_order_ids]
-    dist_named = {get_name(n): d for n, d in distances.items()}
-    tree_named = {
-        get_name(n): (None if parent[n] is None else get_name(parent[n]))
-        for n in parent
-    }
+    if not return_full_result:
+        return path
 
     elapsed = (perf_counter() - start_time) * 1000
 
-    result = BFSResult(
-        path=path,
-        visited_order=visited_order,
-        distances=dist_named,
-        exploration_tree=tree_named,
+    # Named views are materialized lazily from the id state
+    return BFSResult.from_ids(
+        graph.name_table().__getitem__,
+        path,
+        visited_order_ids,
+        distances,
+        parent,
         time_ms=elapsed,
         reachable=(len(path) > 0),
     )
 
-    return result if return_full_result else path
-
 
 # =====================================================================
 # PATH RECONSTRUCTION HELPER
@@ -166,3 +236,294 @@ def _reconstruct_path(
 
     result.reverse()
     return [get_name(n) for n in result]
+
+
+# =====================================================================
+# BIDIRECTIONAL BFS (meet in the middle)
+# =====================================================================
+def _bidirectional_bfs(
+    graph,
+    start_id: int,
+    target_id: int,
+    start_time: float,
+    return_full_result: bool,
+    deterministic: bool = True,
+) -> BFSResult | List[str]:
+    """
+    Expand one full BFS level at a time from whichever side currently
+    has the smaller frontier. Once a level touches the other search,
+    the best meeting edge of that level gives a shortest path.
+    """
+
+    neighbors_of = graph.sorted_neighbors if deterministic else graph.iter_neighbors
+    get_name = graph.get_user_name
+
+    parent_fwd: Dict[int, Optional[int]] = {start_id: None}
+    parent_bwd: Dict[int, Optional[int]] = {target_id: None}
+    dist_fwd: Dict[int, int] = {start_id: 0}
+    dist_bwd: Dict[int, int] = {target_id: 0}
+    frontier_fwd = [start_id]
+    frontier_bwd = [target_id]
+    visited_order_ids: List[int] = []
+
+    meeting: Optional[tuple] = None  # (x on forward side, y on backward side)
+
+    while frontier_fwd and frontier_bwd and meeting is None:
+        forward = len(frontier_fwd) <= len(frontier_bwd)
+        if forward:
+            frontier, parent, dist = frontier_fwd, parent_fwd, dist_fwd
+            other_dist = dist_bwd
+        else:
+            frontier, parent, dist = frontier_bwd, parent_bwd, dist_bwd
+            other_dist = dist_fwd
+
+        next_frontier: List[int] = []
+        best_len = None
+
+        for current in frontier:
+            visited_order_ids.append(current)
+            for neighbor in neighbors_of(current):
+                if neighbor in other_dist:
+                    length = dist[current] + 1 + other_dist[neighbor]
+                    if best_len is None or length < best_len:
+                        best_len = length
+                        meeting = (current, neighbor) if forward else (neighbor, current)
+                if neighbor not in parent:
+                    parent[neighbor] = current
+                    dist[neighbor] = dist[current] + 1
+                    next_frontier.append(neighbor)
+
+        if forward:
+            frontier_fwd = next_frontier
+        else:
+            frontier_bwd = next_frontier
+
+    # --------------------------------------------------------
+    # Stitch the two half paths together
+    # --------------------------------------------------------
+    path_ids: List[int] = []
+    if meeting is not None:
+        x, y = meeting
+        while x is not None:
+            path_ids.append(x)
+            x = parent_fwd[x]
+        path_ids.reverse()
+        while y is not None:
+            path_ids.append(y)
+            y = parent_bwd[y]
+
+    path = [get_name(n) for n in path_ids]
+    if not return_full_result:
+        return path
+
+    tree: Dict[int, Optional[int]] = dict(parent_fwd)
+    distances: Dict[int, int] = dict(dist_fwd)
+    for i, n in enumerate(path_ids):
+        tree[n] = path_ids[i - 1] if i > 0 else None
+        distances[n] = i
+
+    elapsed = (perf_counter() - start_time) * 1000
+
+    return BFSResult.from_ids(
+        graph.name_table().__getitem__,
+        path,
+        visited_order_ids,
+        distances,
+        tree,
+        time_ms=elapsed,
+        reachable=(len(path) > 0),
+    )
+
+
+# =====================================================================
+# MULTI-SOURCE, DEPTH-BOUNDED BFS
+# =====================================================================
+class MultiSourceBFSResult:
+    def __init__(
+        self,
+        distances: Dict[Any, int],
+        nearest_source: Dict[Any, Any],
+        time_ms: float = 0.0,
+    ):
+        # Keyed by internal id, or by username when named=True was asked
+        self.distances = distances
+        self.nearest_source = nearest_source
+        self.time_ms = time_ms
+
+
+def bfs_multi_source(
+    graph: Graph | CSRGraph,
+    sources: Iterable[str],
+    max_depth: Optional[int] = None,
+    named: bool = False,
+    deterministic: bool = True,
+) -> MultiSourceBFSResult:
+    """
+    One BFS from a whole seed set with a shared frontier.
+
+    Every reached user gets its hop distance to the closest seed and
+    that seed (ties go to the seed listed first). Expansion stops after
+    max_depth levels (None → whole components).
+
+    Parameters:
+        graph         : Graph or CSRGraph
+        sources       : seed usernames (unknown names are ignored)
+        max_depth     : depth cutoff, e.g. 2 → everyone within 2 hops
+        named         : True → result dicts keyed by username;
+                        False → keyed by internal id (no name lookups)
+        deterministic : False skips username ordering of neighbors
+    """
+
+    start_time = perf_counter()
+
+    neighbors_of = graph.sorted_neighbors if deterministic else graph.iter_neighbors
+
+    distances: Dict[int, int] = {}
+    nearest: Dict[int, int] = {}
+    frontier: List[int] = []
+
+    for name in sources:
+        if graph.has_user(name):
+            sid = graph.get_user_id(name)
+            if sid not in distances:
+                distances[sid] = 0
+                nearest[sid] = sid
+                frontier.append(sid)
+
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier: List[int] = []
+        for current in frontier:
+            seed = nearest[current]
+            for neighbor in neighbors_of(current):
+                if neighbor not in distances:
+                    distances[neighbor] = depth
+                    nearest[neighbor] = seed
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    if named:
+        get_name = graph.get_user_name
+        distances = {get_name(n): d for n, d in distances.items()}
+        nearest = {get_name(n): get_name(s) for n, s in nearest.items()}
+
+    elapsed = (perf_counter() - start_time) * 1000
+    return MultiSourceBFSResult(distances, nearest, elapsed)
+
+
+def k_hop_neighborhood(
+    graph: Graph | CSRGraph,
+    users: Iterable[str],
+    k: int,
+    include_sources: bool = False,
+) -> List[str]:
+    """Usernames within k hops of any of users (unordered)."""
+    result = bfs_multi_source(graph, users, max_depth=k, deterministic=False)
+    get_name = graph.get_user_name
+    return [
+        get_name(n) for n, d in result.distances.items()
+        if include_sources or d > 0
+    ]
+
+
+# =====================================================================
+# DIRECTION-OPTIMIZING BFS (whole-graph distances)
+# =====================================================================
+TOP_DOWN_ALPHA = 14   # go bottom-up once frontier edges > unexplored edges / alpha
+BOTTOM_UP_BETA = 24   # go back top-down once frontier < n / beta
+
+
+def bfs_distances(
+    graph: Graph | CSRGraph,
+    start_user: str,
+    alpha: int = TOP_DOWN_ALPHA,
+    beta: int = BOTTOM_UP_BETA,
+) -> array:
+    """
+    Hop distance from start_user to every user, as an array('i') indexed
+    by internal id (-1 = unreachable or deleted id).
+
+    Level-synchronous BFS over a CSR snapshot that switches direction
+    per level (Beamer et al.):
+        top-down  : scan the frontier's neighbors for unvisited users
+        bottom-up : every unvisited user scans its own neighbors for a
+                    frontier member and stops at the first hit
+    Bottom-up wins when the frontier covers much of a dense cluster,
+    since most top-down edge checks would hit already-visited users.
+    Frontier membership is a bytearray bitmap.
+    """
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+
+    if not csr.has_user(start_user):
+        return array("i", [-1]) * csr.num_ids()
+
+    return csr_distances(
+        csr.offsets, memoryview(csr.targets), csr.get_user_id(start_user),
+        alpha, beta,
+    )
+
+
+def csr_distances(
+    offsets,
+    targets,
+    source: int,
+    alpha: int = TOP_DOWN_ALPHA,
+    beta: int = BOTTOM_UP_BETA,
+) -> array:
+    """
+    bfs_distances on raw CSR buffers (any int sequences, e.g. memoryviews
+    of shared memory); source is an internal id.
+    """
+
+    n = len(offsets) - 1
+    dist = array("i", [-1]) * n
+    dist[source] = 0
+    frontier = [source]
+    unvisited: Optional[List[int]] = None   # only needed while bottom-up
+
+    edges_unexplored = offsets[n] - (offsets[source + 1] - offsets[source])
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        level += 1
+        edges_frontier = sum(offsets[x + 1] - offsets[x] for x in frontier)
+
+        if not bottom_up and edges_frontier * alpha > edges_unexplored:
+            bottom_up = True
+            unvisited = [
+                x for x in range(n)
+                if dist[x] < 0 and offsets[x + 1] > offsets[x]
+            ]
+        elif bottom_up and len(frontier) * beta < n:
+            bottom_up = False
+
+        next_frontier: List[int] = []
+
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for x in frontier:
+                in_frontier[x] = 1
+            still_unvisited: List[int] = []
+            for v in unvisited:
+                for u in targets[offsets[v]:offsets[v + 1]]:
+                    if in_frontier[u]:
+                        dist[v] = level
+                        next_frontier.append(v)
+                        break
+                else:
+                    still_unvisited.append(v)
+            unvisited = still_unvisited
+        else:
+            for u in frontier:
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    if dist[v] < 0:
+                        dist[v] = level
+                        next_frontier.append(v)
+
+        edges_unexplored -= sum(offsets[x + 1] - offsets[x] for x in next_frontier)
+        frontier = next_frontier
+
+    return dist
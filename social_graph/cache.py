@@ -0,0 +1,233 @@
+# social_graph/cache.py
+
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+
+from .bfs import bfs_shortest_path
+from .dfs import dfs_shortest_path, dfs_traversal
+from .graph import Graph
+from .recommendation import rank_recommendations, recommend_friends
+
+
+DEFAULT_MAX_ENTRIES = 256   # cached results kept per graph
+
+_MISSING = object()
+
+
+class _Entry:
+    __slots__ = ("result", "touched", "anchor", "label", "stamp", "any_user")
+
+    def __init__(self, result, touched, anchor, label, stamp, any_user):
+        self.result = result
+        self.touched = touched      # users whose friend lists were read
+        self.anchor = anchor        # user whose whole community was read
+        self.label = label          # community label of anchor (or None)
+        self.stamp = stamp          # change counter of that community
+        self.any_user = any_user    # depends on the set of all users
+
+
+class QueryCache:
+    """
+    LRU cache of query results for one Graph, invalidated selectively.
+
+    Every entry records what its result depends on:
+
+        touched  : the users whose friend lists the search read. An edge
+                   (u, v) only changes the friend lists of u and v, so
+                   the entry is dropped when u or v was touched.
+        anchor   : for queries that read a whole community, the start
+                   user and that community's label (Graph.component_of),
+                   checked against a per-community change counter. Edits
+                   in another community leave the entry alone; merges and
+                   splits relabel the anchor and so invalidate it too.
+
+    The graph's mutation listener (Graph.add_listener) drives this, so a
+    write only costs work proportional to the entries it actually hits.
+    At most max_entries results are kept; the least recently used goes
+    first. Cached results are shared and must not be modified.
+    """
+
+    def __init__(self, graph: Graph, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.graph = graph
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0      # entries dropped because of a mutation
+
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._by_user: Dict[str, Set[Hashable]] = {}
+        self._any_user: Set[Hashable] = set()
+        self._stamps: Dict[int, int] = {}       # community label → changes
+        self._label_refs: Counter[int] = Counter()
+
+        graph.add_listener(self._on_mutation)
+
+    def close(self) -> None:
+        # Stop listening to the graph (the cache is not used any more)
+        self.graph.remove_listener(self._on_mutation)
+        self.clear()
+
+    # -----------------------------------------------------------------
+    # Core
+    # -----------------------------------------------------------------
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry.label is not None:
+            graph = self.graph
+            if (
+                not graph.has_user(entry.anchor)
+                or graph.component_of(entry.anchor) != entry.label
+                or self._stamps[entry.label] != entry.stamp
+            ):
+                self._drop(key)
+                self.invalidations += 1
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def _store(
+        self,
+        key: Hashable,
+        result: Any,
+        touched: Iterable[str],
+        anchor: Optional[str] = None,
+        any_user: bool = False,
+    ) -> None:
+        touched = set(touched)
+        label = stamp = None
+        if anchor is not None:
+            touched.add(anchor)
+            if self.graph.has_user(anchor):
+                label = self.graph.component_of(anchor)
+                stamp = self._stamps.setdefault(label, 0)
+                self._label_refs[label] += 1
+
+        self._entries[key] = _Entry(result, touched, anchor, label, stamp, any_user)
+        for user in touched:
+            self._by_user.setdefault(user, set()).add(key)
+        if any_user:
+            self._any_user.add(key)
+
+        if len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for user in entry.touched:
+            keys = self._by_user.get(user)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_user[user]
+        self._any_user.discard(key)
+
+        if entry.label is not None:
+            self._label_refs[entry.label] -= 1
+            if not self._label_refs[entry.label]:
+                del self._label_refs[entry.label]
+                del self._stamps[entry.label]
+
+    def _on_mutation(self, op: str, *users: str) -> None:
+        if op == "reset":
+            self.clear()
+            return
+
+        stale = set()
+        for user in users:
+            stale.update(self._by_user.get(user, ()))
+        if op in ("add_user", "delete_user"):
+            stale.update(self._any_user)
+        for key in stale:
+            self._drop(key)
+        self.invalidations += len(stale)
+
+        # Entries anchored in the edited communities see a new stamp
+        if op in ("add_friendship", "remove_friendship") and self._label_refs:
+            for user in users:
+                label = self.graph.component_of(user)
+                if label in self._stamps:
+                    self._stamps[label] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+        self._any_user.clear()
+        self._stamps.clear()
+        self._label_refs.clear()
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -----------------------------------------------------------------
+    # Cached queries
+    # -----------------------------------------------------------------
+    def bfs_shortest_path(
+        self,
+        start_user: str,
+        target_user: str,
+        return_full_result: bool = True,
+        **options,
+    ):
+        key = ("bfs_shortest_path", start_user, target_user, tuple(sorted(options.items())))
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = bfs_shortest_path(self.graph, start_user, target_user, True, **options)
+            # every expanded user is in visited_order
+            self._store(key, result, [start_user, target_user, *result.visited_order])
+        return result if return_full_result else result.path
+
+    def dfs_traversal(self, start_user: str, **options):
+        key = ("dfs_traversal", start_user, tuple(sorted(options.items())))
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = dfs_traversal(self.graph, start_user, **options)
+            self._store(key, result, [], anchor=start_user)
+        return result
+
+    def dfs_shortest_path(
+        self,
+        start_user: str,
+        target_user: str,
+        return_full_result: bool = True,
+    ):
+        key = ("dfs_shortest_path", start_user, target_user)
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = dfs_shortest_path(self.graph, start_user, target_user, True)
+            if result.path:
+                self._store(key, result, [start_user, target_user, *result.visited_order])
+            else:
+                # no path: the search read start_user's whole community
+                self._store(key, result, [target_user], anchor=start_user)
+        return result if return_full_result else result.path
+
+    def recommend_friends(self, username: str, max_results: int = 5):
+        key = ("recommend_friends", username, max_results)
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = recommend_friends(self.graph, username, max_results)
+            # mutual counts only read the friend lists of username's friends
+            self._store(key, result, [username, *self.graph.get_friends(username)])
+        return result
+
+    def rank_recommendations(self, username: str, max_results=None):
+        key = ("rank_recommendations", username, max_results)
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = rank_recommendations(self.graph, username, max_results)
+            # distances cover the community; every other user is a candidate
+            self._store(key, result, [], anchor=username, any_user=True)
+        return result
@@ -0,0 +1,294 @@
+# social_graph/connectivity.py
+
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
+
+from .dsu import ArrayDSU, RollbackDSU
+
+
+# =====================================================================
+# ONLINE: spanning forest with replacement-edge search
+# =====================================================================
+class DynamicConnectivity:
+    """
+    Connected components under edge insertions AND deletions.
+
+    Keeps a spanning forest of the graph plus a component label per node.
+
+        add_edge    : different components → becomes a forest edge and the
+                      smaller component is relabelled (small-to-large).
+        remove_edge : a non-forest edge is dropped in O(1). For a forest
+                      edge both halves of the split tree are searched in
+                      lockstep, so only the smaller half is fully walked;
+                      its graph edges are scanned for a replacement that
+                      reconnects the halves. Only if none exists does the
+                      component split, relabelling the smaller half.
+
+    The structure does not store graph adjacency itself: neighbors(x) must
+    return x's current neighbors, with the removed edge already gone.
+    """
+
+    def __init__(self, neighbors: Callable[[int], Iterable[int]]) -> None:
+        self._neighbors = neighbors
+        self._label: List[int] = []
+        self._members: Dict[int, Set[int]] = {}
+        self._forest: List[Set[int]] = []
+        self._next_label = 0
+
+    @classmethod
+    def build(
+        cls,
+        neighbors: Callable[[int], Iterable[int]],
+        n: int,
+        nodes: Iterable[int],
+        edges: Iterable[Tuple[int, int]],
+    ) -> "DynamicConnectivity":
+        """
+        Bulk construction over ids 0..n-1: an ArrayDSU pass picks the
+        spanning forest (every successful union) and labels() gives the
+        components, instead of relabelling on every add_edge.
+        """
+        index = cls(neighbors)
+        index._label = [-1] * n
+        index._forest = [set() for _ in range(n)]
+
+        dsu = ArrayDSU(n)
+        for u, v in edges:
+            if dsu.union(u, v):
+                index._forest[u].add(v)
+                index._forest[v].add(u)
+
+        labels = dsu.labels()
+        for x in nodes:
+            label = labels[x] + 1
+            index._label[x] = label
+            index._members.setdefault(label, set()).add(x)
+        index._next_label = n
+
+        return index
+
+    # -----------------------------------------------------------------
+    # Nodes
+    # -----------------------------------------------------------------
+    def add_node(self, x: int) -> None:
+        while len(self._label) <= x:
+            self._label.append(-1)
+            self._forest.append(set())
+        label = self._fresh_label()
+        self._label[x] = label
+        self._members[label] = {x}
+        self._forest[x] = set()
+
+    def remove_node(self, x: int) -> None:
+        # x must already be isolated (all of its edges removed)
+        label = self._label[x]
+        members = self._members[label]
+        members.discard(x)
+        if not members:
+            del self._members[label]
+        self._label[x] = -1
+
+    def _fresh_label(self) -> int:
+        self._next_label += 1
+        return self._next_label
+
+    # -----------------------------------------------------------------
+    # Edges
+    # -----------------------------------------------------------------
+    def add_edge(self, u: int, v: int) -> None:
+        lu, lv = self._label[u], self._label[v]
+        if lu == lv:
+            return  # non-forest edge
+
+        self._forest[u].add(v)
+        self._forest[v].add(u)
+
+        # relabel the smaller component into the larger one
+        if len(self._members[lu]) < len(self._members[lv]):
+            lu, lv = lv, lu
+        small = self._members.pop(lv)
+        for x in small:
+            self._label[x] = lu
+        self._members[lu] |= small
+
+    def remove_edge(self, u: int, v: int) -> None:
+        if v not in self._forest[u]:
+            return  # non-forest edge: connectivity unchanged
+
+        self._forest[u].discard(v)
+        self._forest[v].discard(u)
+
+        side = self._smaller_tree_side(u, v)
+
+        # look for a graph edge leaving the smaller side
+        for x in side:
+            for y in self._neighbors(x):
+                if y not in side:
+                    self._forest[x].add(y)
+                    self._forest[y].add(x)
+                    return
+
+        # no replacement: the smaller side becomes its own component
+        old = self._label[u]
+        self._members[old] -= side
+        label = self._fresh_label()
+        self._members[label] = side
+        for x in side:
+            self._label[x] = label
+
+    def _smaller_tree_side(self, u: int, v: int) -> Set[int]:
+        # Walk the two forest trees of u and v one node at a time each;
+        # the first walk to run out has found the whole smaller tree.
+        forest = self._forest
+        seen = ({u}, {v})
+        stacks = ([u], [v])
+
+        while True:
+            for i in (0, 1):
+                stack = stacks[i]
+                if not stack:
+                    return seen[i]
+                x = stack.pop()
+                for y in forest[x]:
+                    if y not in seen[i]:
+                        seen[i].add(y)
+                        stack.append(y)
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+    def component(self, x: int) -> int:
+        return self._label[x]
+
+    def connected(self, u: int, v: int) -> bool:
+        return self._label[u] == self._label[v]
+
+    def component_count(self) -> int:
+        return len(self._members)
+
+    def component_size(self, x: int) -> int:
+        return len(self._members[self._label[x]])
+
+    def components(self) -> List[Set[int]]:
+        return list(self._members.values())
+
+
+# =====================================================================
+# OFFLINE: divide and conquer over edge lifetimes
+# =====================================================================
+def replay_component_counts(records: Sequence[Sequence[str]]) -> List[int]:
+    """
+    Community count after each record of a mutation log (see
+    social_graph.mutation_log), computed offline.
+
+    Every friendship is alive over an interval of record indices. The
+    intervals are stored in a segment tree over time and a depth-first
+    walk of the tree applies them to a DSU with rollback, so each
+    friendship is unioned O(log T) times and nothing is ever deleted
+    from the DSU: O((V + E log T) log V) in total.
+    """
+
+    T = len(records)
+    if T == 0:
+        return []
+
+    # -------------------------------------------------------------
+    # 1. Linear pass: node ids, edge lifetimes, live user counts
+    # -------------------------------------------------------------
+    ids: Dict[str, int] = {}
+    adj: Dict[str, Set[str]] = {}
+    edge_start: Dict[Tuple[str, str], int] = {}
+    intervals: List[Tuple[int, int, int, int]] = []  # (start, end, u, v)
+    alive: List[int] = []
+
+    def node(name: str) -> int:
+        if name not in ids:
+            ids[name] = len(ids)
+        return ids[name]
+
+    def end_edge(a: str, b: str, t: int) -> None:
+        key = (a, b) if a < b else (b, a)
+        start = edge_start.pop(key)
+        if start < t:
+            intervals.append((start, t, ids[a], ids[b]))
+        adj[a].discard(b)
+        adj[b].discard(a)
+
+    for t, (op, *args) in enumerate(records):
+        if op == "add_user":
+            node(args[0])
+            adj.setdefault(args[0], set())
+        elif op == "add_friendship":
+            a, b = args
+            if a != b:
+                for name in (a, b):
+                    node(name)
+                    adj.setdefault(name, set())
+                if b not in adj[a]:
+                    adj[a].add(b)
+                    adj[b].add(a)
+                    edge_start[(a, b) if a < b else (b, a)] = t
+        elif op == "remove_friendship":
+            a, b = args
+            if a in adj and b in adj[a]:
+                end_edge(a, b, t)
+        elif op == "delete_user":
+            a = args[0]
+            if a in adj:
+                for b in list(adj[a]):
+                    end_edge(a, b, t)
+                del adj[a]
+        alive.append(len(adj))
+
+    for (a, b), start in edge_start.items():
+        intervals.append((start, T, ids[a], ids[b]))
+
+    # -------------------------------------------------------------
+    # 2. Segment tree over time [0, T)
+    # -------------------------------------------------------------
+    size = 1
+    while size < T:
+        size *= 2
+    segments: List[List[Tuple[int, int]]] = [[] for _ in range(2 * size)]
+
+    for start, end, u, v in intervals:
+        lo, hi = start + size, end + size
+        while lo < hi:
+            if lo & 1:
+                segments[lo].append((u, v))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                segments[hi].append((u, v))
+            lo //= 2
+            hi //= 2
+
+    # -------------------------------------------------------------
+    # 3. Depth-first walk with rollback
+    # -------------------------------------------------------------
+    dsu = RollbackDSU(len(ids))
+    counts = [0] * T
+    marks: List[int] = []   # DSU history length on entering each segment
+    stack = [(1, False)]
+
+    while stack:
+        seg, leaving = stack.pop()
+        if leaving:
+            dsu.rollback(marks.pop())
+            continue
+
+        if seg >= size + T:
+            continue  # padding leaf beyond the last record
+
+        marks.append(dsu.snapshot())
+        for u, v in segments[seg]:
+            dsu.union(u, v)
+        stack.append((seg, True))
+
+        if seg >= size:
+            t = seg - size
+            counts[t] = alive[t] - dsu.merges
+        else:
+            stack.append((2 * seg + 1, False))
+            stack.append((2 * seg, False))
+
+    return counts
@@ -0,0 +1,111 @@
+# social_graph/csr.py
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+
+class CSRGraph:
+    """
+    Read-only compressed sparse row (CSR) snapshot of a Graph.
+
+    Adjacency is stored in two contiguous int arrays:
+        offsets : length n + 1, neighbors of uid live in
+                  targets[offsets[uid]:offsets[uid + 1]]
+        targets : neighbor ids, each row ordered by username
+
+    User ids are identical to the ids of the Graph it was frozen from,
+    so ids can be passed between the two freely. Neighbor rows are
+    returned as memoryview slices, so traversals never copy them.
+    """
+
+    def __init__(
+        self,
+        names: List[Optional[str]],
+        offsets: array,
+        targets: array,
+    ) -> None:
+        self._id_to_user = names
+        self._user_to_id: Dict[str, int] = {
+            name: uid for uid, name in enumerate(names) if name is not None
+        }
+        self.offsets = offsets
+        self.targets = targets
+        self._targets_view = memoryview(targets)
+
+    # =====================================================================
+    # USERS
+    # =====================================================================
+    def has_user(self, username: str) -> bool:
+        return username in self._user_to_id
+
+    def get_all_users(self) -> List[str]:
+        return list(self._user_to_id.keys())
+
+    def get_user_id(self, username: str) -> int:
+        return self._user_to_id[username]
+
+    def get_user_name(self, uid: int) -> str:
+        return self._id_to_user[uid]
+
+    def name_table(self) -> Sequence[Optional[str]]:
+        # The snapshot never changes, so its own list can be shared
+        return self._id_to_user
+
+    def num_ids(self) -> int:
+        return len(self.offsets) - 1
+
+    def num_edges(self) -> int:
+        return len(self.targets) // 2
+
+    # =====================================================================
+    # NEIGHBORS
+    # =====================================================================
+    def get_neighbors(self, uid: int) -> memoryview:
+        return self._targets_view[self.offsets[uid]:self.offsets[uid + 1]]
+
+    def sorted_neighbors(self, uid: int) -> memoryview:
+        # Rows are already stored in username order.
+        return self.get_neighbors(uid)
+
+    def iter_neighbors(self, uid: int) -> memoryview:
+        return self.get_neighbors(uid)
+
+    def degree(self, uid: int) -> int:
+        return self.offsets[uid + 1] - self.offsets[uid]
+
+    def get_friends(self, username: str) -> List[str]:
+        if not self.has_user(username):
+            return []
+        get_name = self._id_to_user.__getitem__
+        return [get_name(v) for v in self.get_neighbors(self._user_to_id[username])]
+
+    def are_friends(self, u: str, v: str) -> bool:
+        if not self.has_user(u) or not self.has_user(v):
+            return False
+        row = self.get_neighbors(self._user_to_id[u])
+        i = bisect_left(row, v, key=self._id_to_user.__getitem__)
+        return i < len(row) and row[i] == self._user_to_id[v]
+
+
+def build_csr(
+    names: List[Optional[str]],
+    rows,
+    ordered: bool = False,
+) -> CSRGraph:
+    """
+    Build a CSRGraph from per-id neighbor collections.
+
+    rows[uid] may be any iterable of neighbor ids; each row is ordered
+    by username before being packed unless ordered=True says the rows
+    already are.
+    """
+    get_name = names.__getitem__
+    offsets = array("i", [0])
+    targets = array("i")
+
+    for row in rows:
+        targets.extend(row if ordered else sorted(row, key=get_name))
+        offsets.append(len(targets))
+
+    return CSRGraph(names, offsets, targets)
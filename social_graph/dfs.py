@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Any
 from time import perf_counter
+from .csr import CSRGraph
 from .graph import Graph
 
 
@@ -27,7 +28,12 @@ class DFSResult:
 # =====================================================================
 # MAIN DFS TRAVERSAL (Tree + timestamps)
 # =====================================================================
-def dfs_traversal(graph: Graph, start_user: str, return_full: bool = True):
+def dfs_traversal(
+    graph: Graph | CSRGraph,
+    start_user: str,
+    return_full: bool = True,
+    deterministic: bool = True,
+):
 
     start_time = perf_counter()
 
@@ -36,39 +42,66 @@ def dfs_traversal(graph: Graph, start_user: str, return_full: bool = True):
 
     start_id = graph.get_user_id(start_user)
 
-    get_neighbors = graph.get_neighbors
+    # deterministic=False skips username ordering of neighbors
+    neighbors_of = graph.sorted_neighbors if deterministic else graph.iter_neighbors
     get_name = graph.get_user_name
 
-    visited = set()
-    parent = {start_id: None}
-    depth = {}
-    order_ids = []
-
-    tin, tout = {}, {}
-    timer = [1]
-
-    def dfs(u, d):
-        visited.add(u)
-        depth[u] = d
-        order_ids.append(u)
-        tin[u] = timer[0]
-        timer[0] += 1
-
-        for v in sorted(get_neighbors(u), key=get_name):
-            if v not in visited:
+    # Per-id arrays instead of dicts: ids are dense, so indexing a list
+    # is cheaper than hashing and the named dicts are built once at the end.
+    n = graph.num_ids()
+    visited = bytearray(n)
+    parent = [-1] * n
+    depth = [0] * n
+    tin = [0] * n
+    tout = [0] * n
+    order_ids = [start_id]
+
+    visited[start_id] = 1
+    tin[start_id] = 1
+    timer = 2
+
+    # Explicit stack of neighbor iterators: stack[i] belongs to path[i].
+    # Same visit order and timestamps as the recursive formulation,
+    # without the recursion limit or per-node frame overhead.
+    path = [start_id]
+    stack = [iter(neighbors_of(start_id))]
+    push_path, pop_path = path.append, path.pop
+    push_iter, pop_iter = stack.append, stack.pop
+    record_order = order_ids.append
+    d = 0  # depth of path[-1]
+
+    while stack:
+        u = path[-1]
+        for v in stack[-1]:
+            if not visited[v]:
+                visited[v] = 1
                 parent[v] = u
-                dfs(v, d + 1)
-
-        tout[u] = timer[0]
-        timer[0] += 1
-
-    dfs(start_id, 0)
+                d += 1
+                depth[v] = d
+                record_order(v)
+                tin[v] = timer
+                timer += 1
+
+                push_path(v)
+                push_iter(iter(neighbors_of(v)))
+                break
+        else:
+            # all neighbors done → close u
+            tout[u] = timer
+            timer += 1
+            pop_iter()
+            pop_path()
+            d -= 1
 
     order_names = [get_name(n) for n in order_ids]
-    parent_named = {get_name(k): (None if v is None else get_name(v)) for k, v in parent.items()}
-    depth_named = {get_name(k): v for k, v in depth.items()}
-    tin_named = {get_name(k): v for k, v in tin.items()}
-    tout_named = {get_name(k): v for k, v in tout.items()}
+    name_of = dict(zip(order_ids, order_names))
+    parent_named = {
+        name: (None if parent[u] < 0 else name_of[parent[u]])
+        for u, name in zip(order_ids, order_names)
+    }
+    depth_named = {name: depth[u] for u, name in zip(order_ids, order_names)}
+    tin_named = {name: tin[u] for u, name in zip(order_ids, order_names)}
+    tout_named = {name: tout[u] for u, name in zip(order_ids, order_names)}
 
     elapsed = (perf_counter() - start_time) * 1000
 
@@ -86,51 +119,74 @@ class DFSPathResult:
 
 
 def dfs_shortest_path(graph, start_user, target_user, return_full_result=True):
-    print(" dfs_shortest_path CALLED")
+    """
+    Find a shortest path between two users with a pruned, iterative DFS.
+
+    A node is only (re-)entered when it is reached at a strictly smaller
+    depth than before, and no branch is extended past the best path found
+    so far. Every node is therefore expanded at most V times, which keeps
+    the search polynomial (O(V * E)) instead of enumerating every simple
+    path, and the explicit stack avoids Python's recursion limit.
+
+    visited_order is the order in which the search first reached each
+    node (used by DFSAnimator); distances maps path users to their hop
+    index along the returned path.
+    """
 
     if not graph.has_user(start_user) or not graph.has_user(target_user):
-        return DFSPathResult([], [], {})
+        return DFSPathResult([], [], {}) if return_full_result else []
 
     start = graph.get_user_id(start_user)
     target = graph.get_user_id(target_user)
 
-    get_neighbors = graph.get_neighbors
+    sorted_neighbors = graph.sorted_neighbors
     get_name = graph.get_user_name
 
-    visited = set()
-    path = []
-    all_paths = []  # store every valid path
+    best_depth = {start: 0}
+    order_ids = [start]
+    best_path = [start] if start == target else None
 
-    # Full DFS that finds ALL paths
-    def dfs(u):
-        visited.add(u)
-        path.append(u)
+    path = [start]
+    stack = [iter(sorted_neighbors(start))] if best_path is None else []
 
-        if u == target:
-            all_paths.append(path.copy())
-        else:
-            for v in get_neighbors(u):
-                if v not in visited:
-                    dfs(v)
+    while stack:
+        depth = len(path)  # depth of any child pushed from path[-1]
+        bound = len(best_path) - 1 if best_path is not None else None
+
+        advanced = False
+        for v in stack[-1]:
+            if bound is not None and depth >= bound:
+                break
+            if depth >= best_depth.get(v, depth + 1):
+                continue
+
+            if v not in best_depth:
+                order_ids.append(v)
+            best_depth[v] = depth
 
-        # backtrack
-        visited.remove(u)
-        path.pop()
+            if v == target:
+                best_path = path + [v]
+                bound = depth
+                continue
 
-    # Run full DFS
-    dfs(start)
+            path.append(v)
+            stack.append(iter(sorted_neighbors(v)))
+            advanced = True
+            break
 
-    # If no path found
-    if not all_paths:
-        return DFSPathResult([], [], {})
+        if not advanced:
+            # backtrack
+            stack.pop()
+            path.pop()
 
-    # Choose the SHORTEST path among all found
-    shortest = min(all_paths, key=len)
+    if best_path is None:
+        return DFSPathResult([], [], {}) if return_full_result else []
 
-    # Convert to names
-    shortest_named = [get_name(n) for n in shortest]
+    path_named = [get_name(n) for n in best_path]
+    if not return_full_result:
+        return path_named
 
-    # visited_order for animation = shortest path only
-    visited_order_named = shortest_named.copy()
+    visited_order_named = [get_name(n) for n in order_ids]
+    distances = {name: i for i, name in enumerate(path_named)}
 
-    return DFSPathResult(shortest_named, visited_order_named, {})
+    return DFSPathResult(path_named, visited_order_named, distances)
@@ -1,7 +1,12 @@
 from typing import Dict, List
+from .csr import CSRGraph
 from .graph import Graph
 
-def dfs_iterative(graph: Graph, start_user: str) -> List[str]:
+def dfs_iterative(
+    graph: Graph | CSRGraph,
+    start_user: str,
+    deterministic: bool = True,
+) -> List[str]:
     if not graph.has_user(start_user):
         return []
 
@@ -11,7 +16,8 @@ def dfs_iterative(graph: Graph, start_user: str) -> List[str]:
     visited = set()
     order_ids = []
 
-    get_neighbors = graph.get_neighbors
+    sorted_neighbors = graph.sorted_neighbors
+    iter_neighbors = graph.iter_neighbors
     get_name = graph.get_user_name
 
     while stack:
@@ -20,7 +26,8 @@ def dfs_iterative(graph: Graph, start_user: str) -> List[str]:
             visited.add(u)
             order_ids.append(u)
 
-            neighbors = sorted(get_neighbors(u), key=get_name, reverse=True)
+            # deterministic=False skips username ordering of neighbors
+            neighbors = reversed(sorted_neighbors(u)) if deterministic else iter_neighbors(u)
             for v in neighbors:
                 if v not in visited:
                     stack.append(v)
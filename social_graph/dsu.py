@@ -1,3 +1,4 @@
+from array import array
 from typing import Dict, List
 
 
@@ -63,3 +64,121 @@ class DSU:
             named_comps[root_name] = [id_to_user[x] for x in group]
 
         return named_comps
+
+
+class ArrayDSU:
+    """
+    Compact DSU for large graphs: parent and size live in array('i')
+    buffers (4 bytes per entry instead of a Python int object each),
+    find is iterative with path halving, and union is by size.
+
+    component_size(x) and the number of components are O(1); labels()
+    exports a dense component label (0..k-1) for every node in one pass.
+    """
+
+    def __init__(self, n: int = 0):
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.count = n   # number of components
+
+    def add(self) -> int:
+        # New singleton node; returns its id
+        x = len(self.parent)
+        self.parent.append(x)
+        self.size.append(1)
+        self.count += 1
+        return x
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]   # path halving
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        rootX = self.find(x)
+        rootY = self.find(y)
+        if rootX == rootY:
+            return False
+
+        # Union by size
+        if self.size[rootX] < self.size[rootY]:
+            rootX, rootY = rootY, rootX
+        self.parent[rootY] = rootX
+        self.size[rootX] += self.size[rootY]
+        self.count -= 1
+        return True
+
+    def same(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def labels(self) -> array:
+        """
+        Dense component label per node, numbered in order of each
+        component's smallest node id.
+        """
+        n = len(self.parent)
+        find = self.find
+        root_label = array("i", [-1]) * n
+        labels = array("i", bytes(4 * n))
+        next_label = 0
+
+        for x in range(n):
+            root = find(x)
+            label = root_label[root]
+            if label < 0:
+                label = root_label[root] = next_label
+                next_label += 1
+            labels[x] = label
+
+        return labels
+
+
+class RollbackDSU:
+    """
+    DSU whose unions can be undone in LIFO order (used for offline
+    dynamic connectivity). Union by size and no path compression, so
+    find is O(log n) and every union changes exactly one parent pointer.
+    """
+
+    def __init__(self, n: int = 0):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.merges = 0
+        self._history: List[int] = []   # roots that were attached
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        rootX = self.find(x)
+        rootY = self.find(y)
+        if rootX == rootY:
+            return False
+
+        if self.size[rootX] < self.size[rootY]:
+            rootX, rootY = rootY, rootX
+        self.parent[rootY] = rootX
+        self.size[rootX] += self.size[rootY]
+        self._history.append(rootY)
+        self.merges += 1
+        return True
+
+    def snapshot(self) -> int:
+        return len(self._history)
+
+    def rollback(self, mark: int) -> None:
+        # Undo every union made after snapshot() returned mark
+        while len(self._history) > mark:
+            rootY = self._history.pop()
+            rootX = self.parent[rootY]
+            self.parent[rootY] = rootY
+            self.size[rootX] -= self.size[rootY]
+            self.merges -= 1
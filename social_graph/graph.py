@@ -2,17 +2,102 @@
 
 import json
 import os
-from typing import Dict, List, Set
+import threading
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .csr import CSRGraph, build_csr
+from .connectivity import DynamicConnectivity
+from .edge_list import EDGE_CHUNK, read_edge_chunks
+from .mutation_log import MutationLog, read_log
+from .storage import is_binary_path, open_binary, write_binary
 
 
 GRAPH_FILE = "graph_data.json"   # persistent storage file
+COMPACT_THRESHOLD = 0.5          # renumber ids once half of them are tombstones
+LOG_SUFFIX = ".log"              # mutation log lives next to the snapshot
+CHECKPOINT_EVERY = 1000          # log records before sync() checkpoints
+
+
+class GraphObserver:
+    """
+    Base class for objects that follow a Graph's changes; register with
+    Graph.add_listener(observer). Each effective mutation calls exactly
+    one method, after the graph has changed:
+
+        add_user          → user_added(username)
+        delete_user       → friendship_removed(...) for each friend,
+                            then user_removed(username)
+        add_friendship    → user_added for new users, friendship_added(u, v)
+        remove_friendship → friendship_removed(u, v)
+        load, compact,
+        bulk_load_edges   → graph_reset(): rebuild from scratch
+
+    Override the ones you need; the defaults ignore the event.
+    """
+
+    def user_added(self, username: str) -> None:
+        pass
+
+    def user_removed(self, username: str) -> None:
+        pass
+
+    def friendship_added(self, u: str, v: str) -> None:
+        pass
+
+    def friendship_removed(self, u: str, v: str) -> None:
+        pass
+
+    def graph_reset(self) -> None:
+        pass
+
+    def __call__(self, op: str, *args: str) -> None:
+        getattr(self, _OBSERVER_EVENTS[op])(*args)
+
+
+_OBSERVER_EVENTS = {
+    "add_user": "user_added",
+    "delete_user": "user_removed",
+    "add_friendship": "friendship_added",
+    "remove_friendship": "friendship_removed",
+    "reset": "graph_reset",
+}
 
 
 class Graph:
     def __init__(self) -> None:
         self._user_to_id: Dict[str, int] = {}
-        self._id_to_user: List[str] = []
+        # Deleted users leave a tombstone (None) whose id goes on the free
+        # list for reuse; compact() renumbers ids to close the gaps.
+        self._id_to_user: List[Optional[str]] = []
+        self._free_ids: List[int] = []
         self._adj: List[Set[int]] = []
+        # Same neighbors as _adj, kept ordered by username so traversals
+        # get a deterministic order without sorting on every expansion.
+        self._sorted_adj: List[List[int]] = []
+
+        # Live community index, kept correct under adds AND removals;
+        # only bulk renumbering (compact/load) marks it dirty for a rebuild.
+        self._communities = DynamicConnectivity(self.iter_neighbors)
+        self._communities_dirty = False
+
+        # Bumped by every mutation, load and compact; cached query results
+        # computed at an older version are stale (see social_graph.cache)
+        self.version = 0
+        # True once _id_to_user was handed out by name_table()
+        self._names_shared = False
+        # Called as listener(op, *usernames) after every effective mutation
+        # (see add_listener); op "reset" means ids/communities were rebuilt
+        self._listeners: List[Callable[..., None]] = []
+
+        # Canvas positions from the last layout run (social_graph.layout),
+        # saved with the graph so windows can reuse them
+        self._positions: Dict[str, Tuple[float, float]] = {}
+
+        # Append-only mutation log (see enable_log); None = not logging
+        self._log: Optional[MutationLog] = None
+        self._snapshot_path: Optional[str] = None
+        self._checkpoint_thread: Optional[threading.Thread] = None
 
     # =====================================================================
     # USER MANAGEMENT
@@ -25,10 +110,19 @@ class Graph:
         if username in self._user_to_id:
             return
 
-        new_id = len(self._id_to_user)
+        if self._free_ids:
+            new_id = self._free_ids.pop()
+            self._set_name(new_id, username)
+        else:
+            new_id = len(self._id_to_user)
+            self._id_to_user.append(username)
+            self._adj.append(set())
+            self._sorted_adj.append([])
         self._user_to_id[username] = new_id
-        self._id_to_user.append(username)
-        self._adj.append(set())
+        if not self._communities_dirty:
+            self._communities.add_node(new_id)   # new singleton community
+
+        self._mutated("add_user", username)
 
     def has_user(self, username: str) -> bool:
         return username in self._user_to_id
@@ -52,9 +146,21 @@ class Graph:
         uid = self._user_to_id[u]
         vid = self._user_to_id[v]
 
+        if vid in self._adj[uid]:
+            return
+
         self._adj[uid].add(vid)
         self._adj[vid].add(uid)
 
+        name_of = self._id_to_user.__getitem__
+        insort(self._sorted_adj[uid], vid, key=name_of)
+        insort(self._sorted_adj[vid], uid, key=name_of)
+
+        if not self._communities_dirty:
+            self._communities.add_edge(uid, vid)
+
+        self._mutated("add_friendship", u, v)
+
     def get_friends(self, username: str) -> List[str]:
         if not self.has_user(username):
             return []
@@ -74,35 +180,198 @@ class Graph:
         vid = self._user_to_id[v]
         self._adj[uid].discard(vid)
         self._adj[vid].discard(uid)
+        self._remove_sorted(uid, vid)
+        self._remove_sorted(vid, uid)
+        if not self._communities_dirty:
+            self._communities.remove_edge(uid, vid)
+
+        self._mutated("remove_friendship", u, v)
+
+    def bulk_load_edges(
+        self,
+        source: str | Iterable[Sequence[str]],
+        delimiter: Optional[str] = None,
+        chunk_size: int = EDGE_CHUNK,
+        skip_header: bool = False,
+    ) -> int:
+        """
+        Add every friendship of an edge list (CSV/TSV file path or an
+        iterable of (user, user) rows, see edge_list.read_edge_chunks).
+
+        The input is streamed in chunks. Each name costs one dict lookup,
+        duplicates and self-loops are dropped by the adjacency sets, and
+        the username-ordered rows and the community index are rebuilt
+        once at the end instead of per friendship. Nothing is written to
+        the mutation log record by record; if logging is enabled the
+        result is checkpointed instead. Listeners get a "reset".
+
+        If reading the source fails part way, the friendships read before
+        the error stay loaded (with the same cleanup) and the error is
+        re-raised.
+
+        Returns the number of friendships added. For a read-only CSR
+        snapshot without building a Graph, see edge_list.load_edge_list_csr.
+        """
+        ids = self._user_to_id
+        adj = self._adj
+        changed: Set[int] = set()
+        added = 0
+
+        def intern(name: str) -> int:
+            if self._free_ids:
+                uid = self._free_ids.pop()
+                self._set_name(uid, name)
+            else:
+                uid = len(self._id_to_user)
+                self._id_to_user.append(name)
+                adj.append(set())
+                self._sorted_adj.append([])
+            ids[name] = uid
+            return uid
+
+        # A source that fails part way (bad file, Ctrl-C) keeps the edges
+        # read so far; the derived state is brought in line either way.
+        try:
+            for chunk in read_edge_chunks(source, delimiter, chunk_size, skip_header):
+                for u, v in chunk:
+                    if not u or not v or u == v:
+                        continue
+                    uid = ids.get(u)
+                    if uid is None:
+                        uid = intern(u)
+                    vid = ids.get(v)
+                    if vid is None:
+                        vid = intern(v)
+                    row = adj[uid]
+                    if vid not in row:
+                        row.add(vid)
+                        adj[vid].add(uid)
+                        changed.add(uid)
+                        changed.add(vid)
+                        added += 1
+        finally:
+            name_of = self._id_to_user.__getitem__
+            for uid in changed:
+                self._sorted_adj[uid] = sorted(adj[uid], key=name_of)
+
+            self._communities_dirty = True
+            self.version += 1
+            self._notify("reset")
+            if self._log is not None:
+                self.checkpoint()
+        return added
+
+    def _remove_sorted(self, uid: int, vid: int) -> None:
+        row = self._sorted_adj[uid]
+        i = bisect_left(row, self._id_to_user[vid], key=self._id_to_user.__getitem__)
+        del row[i]
+
     def delete_user(self, username: str) -> None:
         if username not in self._user_to_id:
             return
 
         uid = self._user_to_id[username]
 
-        # 1. Remove the user from mapping structures
+        # 1. Detach from neighbors: O(degree), ids of other users are kept.
+        #    Edges go one at a time so the community index never sees a
+        #    half-removed edge while searching for replacements.
+        for n in list(self._adj[uid]):
+            self._adj[uid].discard(n)
+            self._adj[n].discard(uid)
+            self._remove_sorted(n, uid)
+            if not self._communities_dirty:
+                self._communities.remove_edge(uid, n)
+            self._notify("remove_friendship", username, self._id_to_user[n])
+        if not self._communities_dirty:
+            self._communities.remove_node(uid)
+
+        # 2. Tombstone the id and recycle it
         del self._user_to_id[username]
-        self._id_to_user.pop(uid)
-        self._adj.pop(uid)
+        self._set_name(uid, None)
+        self._positions.pop(username, None)
+        self._adj[uid] = set()
+        self._sorted_adj[uid] = []
+        self._free_ids.append(uid)
+
+        self._mutated("delete_user", username)
+
+        # 3. Renumber lazily once tombstones dominate (amortized O(1))
+        self.compact()
+
+    def fragmentation(self) -> float:
+        # Fraction of ids that are tombstones
+        if not self._id_to_user:
+            return 0.0
+        return len(self._free_ids) / len(self._id_to_user)
+
+    def compact(self, threshold: float = COMPACT_THRESHOLD) -> bool:
+        """
+        Renumber ids densely in one O(V + E) pass, dropping tombstones.
+
+        Only runs when fragmentation() exceeds threshold (pass 0 to force
+        it whenever there is a tombstone). Relative id order and username
+        order of neighbors are preserved. Returns True if ids changed.
+        """
+        if not self._free_ids or self.fragmentation() <= threshold:
+            return False
 
-        # 2. Rebuild ID mappings because indices shifted!
-        new_user_to_id = {}
-        for new_id, name in enumerate(self._id_to_user):
-            new_user_to_id[name] = new_id
-        self._user_to_id = new_user_to_id
+        remap = {}
+        for old_id, name in enumerate(self._id_to_user):
+            if name is not None:
+                remap[old_id] = len(remap)
+
+        live = list(remap)
+        self._id_to_user = [self._id_to_user[i] for i in live]
+        self._names_shared = False
+        self._user_to_id = {name: i for i, name in enumerate(self._id_to_user)}
+        self._adj = [{remap[n] for n in self._adj[i]} for i in live]
+        self._sorted_adj = [[remap[n] for n in self._sorted_adj[i]] for i in live]
+        self._free_ids = []
+        self._communities_dirty = True
+        self.version += 1
+        self._notify("reset")
+        return True
 
-        # 3. Fix adjacency lists: remove deleted user & shift indices > uid
-        new_adj = []
-        for neighbors in self._adj:
-            updated = set()
-            for n in neighbors:
-                if n == uid:
-                    continue  # remove deleted user
-                # shift indices
-                updated.add(n - 1 if n > uid else n)
-            new_adj.append(updated)
+    # =====================================================================
+    # COMMUNITIES (connected components)
+    # =====================================================================
+    def _community_index(self) -> DynamicConnectivity:
+        if self._communities_dirty:
+            edges = (
+                (uid, vid)
+                for uid, row in enumerate(self._adj)
+                for vid in row
+                if uid < vid
+            )
+            self._communities = DynamicConnectivity.build(
+                self.iter_neighbors,
+                len(self._id_to_user),
+                self._user_to_id.values(),
+                edges,
+            )
+            self._communities_dirty = False
+        return self._communities
+
+    def component_of(self, username: str) -> int:
+        # Label of the user's community (changes on merges and splits)
+        return self._community_index().component(self._user_to_id[username])
+
+    def same_community(self, u: str, v: str) -> bool:
+        if not self.has_user(u) or not self.has_user(v):
+            return False
+        return self._community_index().connected(self._user_to_id[u], self._user_to_id[v])
+
+    def community_count(self) -> int:
+        return self._community_index().component_count()
 
-        self._adj = new_adj
+    def communities(self) -> List[List[str]]:
+        # Members of every community, largest community first
+        name_of = self._id_to_user
+        groups = [
+            [name_of[uid] for uid in members]
+            for members in self._community_index().components()
+        ]
+        return sorted(groups, key=lambda g: -len(g))
 
     # =====================================================================
     # INTERNAL ACCESS HELPERS FOR BFS/DFS/Canvas
@@ -113,9 +382,71 @@ class Graph:
     def get_user_name(self, uid: int) -> str:
         return self._id_to_user[uid]
 
+    def name_table(self) -> Sequence[Optional[str]]:
+        """
+        id → username table that stays valid for ids handed out so far,
+        so results can keep it to resolve ids later. O(1): the live list
+        is shared copy-on-write. Appending users leaves existing entries
+        alone; deleting a user or reusing its id copies the list first
+        (_set_name), and compact/load build a new list anyway.
+        """
+        self._names_shared = True
+        return self._id_to_user
+
+    def _set_name(self, uid: int, name: Optional[str]) -> None:
+        # In-place change of an id's name (retired or reused id)
+        if self._names_shared:
+            self._id_to_user = list(self._id_to_user)
+            self._names_shared = False
+        self._id_to_user[uid] = name
+
     def get_neighbors(self, uid: int) -> List[int]:
         return list(self._adj[uid])
 
+    def sorted_neighbors(self, uid: int) -> List[int]:
+        # Neighbors in username order (deterministic traversal order).
+        # Returns the live index row: callers must not modify it.
+        return self._sorted_adj[uid]
+
+    def iter_neighbors(self, uid: int) -> Set[int]:
+        # Unordered neighbors without copying (traversal fast path).
+        # Returns the live adjacency set: callers must not modify it.
+        return self._adj[uid]
+
+    def num_ids(self) -> int:
+        return len(self._id_to_user)
+
+    # =====================================================================
+    # LAYOUT POSITIONS
+    # =====================================================================
+    def get_positions(self) -> Dict[str, Tuple[float, float]]:
+        return dict(self._positions)
+
+    def get_position(self, username: str) -> Optional[Tuple[float, float]]:
+        return self._positions.get(username)
+
+    def set_positions(self, positions: Dict[str, Tuple[float, float]]) -> None:
+        # Positions of users that no longer exist are ignored
+        self._positions = {
+            name: (float(x), float(y))
+            for name, (x, y) in positions.items()
+            if name in self._user_to_id
+        }
+
+    # =====================================================================
+    # FROZEN SNAPSHOT
+    # =====================================================================
+    def freeze(self) -> CSRGraph:
+        """
+        Return a read-only CSR snapshot of the current graph.
+
+        The snapshot shares user ids with this graph and can be passed to
+        bfs_shortest_path, dfs_traversal, dfs_iterative and
+        recommend_friends in place of the Graph itself. Later mutations
+        of this graph are not reflected in the snapshot.
+        """
+        return build_csr(list(self._id_to_user), self._sorted_adj, ordered=True)
+
     # =====================================================================
     # ADJACENCY REPRESENTATIONS
     # =====================================================================
@@ -126,16 +457,23 @@ class Graph:
         return result
 
     def adjacency_matrix(self) -> List[List[int]]:
-        n = len(self._id_to_user)
+        # Rows/columns follow users_in_order() (tombstones skipped)
+        live, remap = self._dense_ids()
+        n = len(live)
         matrix = [[0] * n for _ in range(n)]
-        for u in range(n):
-            for v in self._adj[u]:
-                matrix[u][v] = 1
-                matrix[v][u] = 1
+        for u, old in enumerate(live):
+            for v in self._adj[old]:
+                matrix[u][remap[v]] = 1
+                matrix[remap[v]][u] = 1
         return matrix
 
     def users_in_order(self) -> List[str]:
-        return list(self._id_to_user)
+        return [name for name in self._id_to_user if name is not None]
+
+    def _dense_ids(self):
+        # Live ids in id order, plus old id → dense position
+        live = [uid for uid, name in enumerate(self._id_to_user) if name is not None]
+        return live, {old: new for new, old in enumerate(live)}
 
     def print_adjacency_list(self) -> str:
         lines = []
@@ -159,24 +497,220 @@ class Graph:
     # =====================================================================
     # PERSISTENCE (SAVE & LOAD)
     # =====================================================================
-    def save(self):
+    def save(self, path: str = GRAPH_FILE):
+        """
+        Save the graph. Paths ending in .sgx use the compact binary
+        format (see social_graph.storage), anything else is JSON.
+        """
+        # Tombstones are never written: ids are saved densely renumbered
+        live, remap = self._dense_ids()
+
+        if is_binary_path(path):
+            write_binary(
+                path,
+                [self._id_to_user[uid] for uid in live],
+                ([remap[n] for n in self._sorted_adj[uid]] for uid in live),
+            )
+            return
+
         data = {
-            "users": self._id_to_user,
-            "adj": [list(neigh) for neigh in self._adj]
+            "users": [self._id_to_user[uid] for uid in live],
+            "adj": [[remap[n] for n in self._sorted_adj[uid]] for uid in live]
         }
-        with open(GRAPH_FILE, "w") as f:
+        if self._positions:
+            # [x, y] per user, null if never laid out (binary files skip this)
+            data["positions"] = [
+                self._positions.get(self._id_to_user[uid]) for uid in live
+            ]
+        with open(path, "w") as f:
             json.dump(data, f, indent=4)
 
-    def load(self):
-        if not os.path.exists(GRAPH_FILE):
+    def load(self, path: str = GRAPH_FILE):
+        """
+        Load the snapshot at path, then replay its mutation log(s) so
+        edits made since the last checkpoint are recovered.
+        """
+        log, self._log = self._log, None   # replay must not re-log
+        self._communities_dirty = True
+        self.version += 1
+        try:
+            self._load_snapshot(path)
+            self._replay_logs(path)
+        finally:
+            self._log = log
+        self._notify("reset")
+
+    def _load_snapshot(self, path: str):
+        if not os.path.exists(path):
             return  # first run → no saved data
 
-        with open(GRAPH_FILE, "r") as f:
+        if is_binary_path(path):
+            self._load_csr(open_binary(path))
+            return
+
+        with open(path, "r") as f:
             data = json.load(f)
 
         # restore users
         self._id_to_user = data["users"]
+        self._names_shared = False
         self._user_to_id = {name: idx for idx, name in enumerate(self._id_to_user)}
+        self._free_ids = []
+
+        # restore layout (older files have none)
+        self._positions = {
+            name: tuple(pos)
+            for name, pos in zip(self._id_to_user, data.get("positions", []))
+            if pos is not None
+        }
 
         # restore adjacency
         self._adj = [set(neigh) for neigh in data["adj"]]
+        name_of = self._id_to_user.__getitem__
+        self._sorted_adj = [sorted(neigh, key=name_of) for neigh in self._adj]
+
+    def _load_csr(self, csr: CSRGraph) -> None:
+        # Copy a (possibly memory-mapped) CSR snapshot into this graph
+        n = csr.num_ids()
+        self._id_to_user = [csr.get_user_name(uid) for uid in range(n)]
+        self._names_shared = False
+        self._user_to_id = {
+            name: uid for uid, name in enumerate(self._id_to_user) if name is not None
+        }
+        self._free_ids = [uid for uid, name in enumerate(self._id_to_user) if name is None]
+        self._sorted_adj = [list(csr.get_neighbors(uid)) for uid in range(n)]
+        self._adj = [set(row) for row in self._sorted_adj]
+        self._positions = {}   # the binary format stores no layout
+        self._communities_dirty = True
+
+
+    # =====================================================================
+    # MUTATION LOG, LISTENERS & CHECKPOINTS
+    # =====================================================================
+    def _mutated(self, op: str, *args: str) -> None:
+        # Called by every effective mutation
+        self.version += 1
+        if self._log is not None:
+            self._log.append(op, *args)
+        self._notify(op, *args)
+
+    def _notify(self, op: str, *args: str) -> None:
+        for listener in self._listeners:
+            listener(op, *args)
+
+    def add_listener(self, listener: Callable[..., None]) -> None:
+        """
+        Register listener(op, *usernames), called after every effective
+        add_user / add_friendship / remove_friendship / delete_user.
+        delete_user first reports each of the user's friendships as a
+        remove_friendship. op "reset" follows load() and an effective
+        compact(): ids and community labels were rebuilt.
+
+        A GraphObserver instance can be passed to get one method call
+        per event instead.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[..., None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _replay_logs(self, path: str) -> None:
+        # .log.old only exists if a checkpoint was interrupted; its records
+        # are older than the ones in .log. Replaying records the snapshot
+        # already contains is harmless: every operation is idempotent.
+        for log_path in (path + LOG_SUFFIX + ".old", path + LOG_SUFFIX):
+            for op, *args in read_log(log_path):
+                getattr(self, op)(*args)
+
+    def enable_log(self, path: str = GRAPH_FILE, fsync: bool = False) -> None:
+        """
+        Start appending every mutation to path + ".log" instead of
+        rewriting the snapshot at path. Call after load().
+        """
+        self.close_log()
+        self._snapshot_path = path
+        self._log = MutationLog(path + LOG_SUFFIX, fsync=fsync)
+
+    def sync(self) -> None:
+        """
+        Make logged mutations durable (O(1)); once the log has grown past
+        CHECKPOINT_EVERY records, fold it into the snapshot in the
+        background.
+        """
+        if self._log is None:
+            self.save()
+            return
+        self._log.flush()
+        if self._log.records >= CHECKPOINT_EVERY:
+            self.checkpoint(background=True)
+
+    def checkpoint(self, background: bool = False) -> None:
+        """
+        Write a full snapshot and drop the log records it covers.
+
+        The live log is rotated to .log.old and the graph state copied on
+        the calling thread; only the snapshot write (and removal of
+        .log.old) may happen in the background, so mutations can continue
+        meanwhile and go to the fresh log.
+        """
+        if self._log is None:
+            self.save()
+            return
+
+        self.wait_for_checkpoint()
+
+        path = self._snapshot_path
+        log_path = self._log.path
+        old_path = log_path + ".old"
+
+        self._log.close()
+        if os.path.exists(old_path):
+            # An earlier checkpoint never finished: keep its records too
+            with open(old_path, "a", encoding="utf-8") as old, \
+                    open(log_path, "r", encoding="utf-8") as cur:
+                old.write(cur.read())
+            os.remove(log_path)
+        else:
+            os.replace(log_path, old_path)
+        self._log = MutationLog(log_path, fsync=self._log.fsync)
+
+        # save() only reads names and the ordered rows
+        snapshot = Graph()
+        snapshot._id_to_user = list(self._id_to_user)
+        snapshot._sorted_adj = [list(row) for row in self._sorted_adj]
+        snapshot._positions = dict(self._positions)
+
+        def write():
+            root, ext = os.path.splitext(path)
+            tmp_path = root + ".tmp" + ext
+            snapshot.save(tmp_path)
+            os.replace(tmp_path, path)
+            os.remove(old_path)
+
+        if background:
+            self._checkpoint_thread = threading.Thread(target=write, daemon=True)
+            self._checkpoint_thread.start()
+        else:
+            write()
+
+    def wait_for_checkpoint(self) -> None:
+        if self._checkpoint_thread is not None:
+            self._checkpoint_thread.join()
+            self._checkpoint_thread = None
+
+    def close_log(self) -> None:
+        self.wait_for_checkpoint()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+def convert_graph_file(src: str, dst: str) -> None:
+    """
+    Convert between the JSON and binary (.sgx) graph formats; the format
+    of each side is picked from its file extension.
+    """
+    graph = Graph()
+    graph.load(src)
+    graph.save(dst)
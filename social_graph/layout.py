@@ -0,0 +1,332 @@
+# social_graph/layout.py
+
+import math
+import random
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .csr import CSRGraph
+from .graph import Graph
+
+
+EDGE_LENGTH = 120.0     # preferred distance between friends (scene units)
+THETA = 0.7             # Barnes-Hut opening angle (0 = exact, larger = coarser);
+                        # below 1/sqrt(2) a cell never acts on a body inside it
+GRAVITY = 0.02          # pull towards the origin, keeps components together
+COOLING = 0.95          # per-iteration decay of the maximum step
+MIN_STEP = 0.5          # temperature floor, lets warm starts keep settling
+LEAF_SIZE = 4           # bodies per quadtree leaf
+MAX_DEPTH = 24          # coincident points stop subdividing here
+
+Point = Tuple[float, float]
+
+
+# =====================================================================
+# QUADTREE (Barnes-Hut)
+# =====================================================================
+class _QuadTree:
+    """
+    Quadtree over the current positions, rebuilt every iteration.
+
+    Node data lives in flat lists indexed by node id: total mass, centre
+    of mass, cell size, children (None for leaves) and, for leaves, the
+    bodies they hold.
+    """
+
+    def __init__(self, xs: array, ys: array) -> None:
+        self.xs = xs
+        self.ys = ys
+        self.mass: List[int] = []
+        self.com_x: List[float] = []
+        self.com_y: List[float] = []
+        self.size: List[float] = []
+        self.children: List[Optional[List[int]]] = []
+        self.bodies: List[Optional[List[int]]] = []
+
+        n = len(xs)
+        if n == 0:
+            return
+        x0, x1 = min(xs), max(xs)
+        y0, y1 = min(ys), max(ys)
+        size = max(x1 - x0, y1 - y0, 1.0)
+        self._build(list(range(n)), x0, y0, size, 0)
+
+    def _build(self, bodies: List[int], x0: float, y0: float, size: float, depth: int) -> int:
+        node = len(self.mass)
+        xs, ys = self.xs, self.ys
+        self.mass.append(len(bodies))
+        self.com_x.append(sum(xs[i] for i in bodies) / len(bodies))
+        self.com_y.append(sum(ys[i] for i in bodies) / len(bodies))
+        self.size.append(size)
+
+        if len(bodies) <= LEAF_SIZE or depth >= MAX_DEPTH:
+            self.children.append(None)
+            self.bodies.append(bodies)
+            return node
+
+        self.children.append([])
+        self.bodies.append(None)
+
+        half = size / 2
+        mx, my = x0 + half, y0 + half
+        quads: List[List[int]] = [[], [], [], []]
+        for i in bodies:
+            quads[(xs[i] >= mx) + 2 * (ys[i] >= my)].append(i)
+
+        kids = []
+        for q, members in enumerate(quads):
+            if members:
+                qx = mx if q & 1 else x0
+                qy = my if q & 2 else y0
+                kids.append(self._build(members, qx, qy, half, depth + 1))
+        self.children[node] = kids
+        return node
+
+    def repulsion(self, i: int, k2: float, theta2: float) -> Point:
+        # Sum of k^2 / d pushes on body i; far cells act as one body
+        xi, yi = self.xs[i], self.ys[i]
+        xs, ys = self.xs, self.ys
+        mass, com_x, com_y = self.mass, self.com_x, self.com_y
+        size, children, bodies = self.size, self.children, self.bodies
+
+        fx = fy = 0.0
+        stack = [0] if mass else []
+        while stack:
+            node = stack.pop()
+            dx = xi - com_x[node]
+            dy = yi - com_y[node]
+            d2 = dx * dx + dy * dy
+
+            kids = children[node]
+            if kids is None:
+                for j in bodies[node]:
+                    if j == i:
+                        continue
+                    dx = xi - xs[j]
+                    dy = yi - ys[j]
+                    d2 = dx * dx + dy * dy
+                    if d2 < 1e-6:
+                        # coincident: push apart in a fixed direction
+                        dx, dy, d2 = (0.01, 0.0, 1e-4) if i < j else (-0.01, 0.0, 1e-4)
+                    fx += dx / d2 * k2
+                    fy += dy / d2 * k2
+            elif size[node] * size[node] < theta2 * d2:
+                f = mass[node] * k2 / d2
+                fx += dx * f
+                fy += dy * f
+            else:
+                stack.extend(kids)
+
+        return fx, fy
+
+
+# =====================================================================
+# FORCE-DIRECTED LAYOUT
+# =====================================================================
+class ForceLayout:
+    """
+    Fruchterman-Reingold style force-directed layout.
+
+        repulsion  : k^2 / d between every pair of users, approximated
+                     with a Barnes-Hut quadtree → O(n log n) per step
+        attraction : d^2 / k along every friendship
+        gravity    : GRAVITY * d towards the origin
+
+    Each step moves every user at most `temperature` units, and the
+    temperature cools geometrically. Positions are kept in flat
+    array('d') buffers indexed by a dense internal index.
+
+    The layout is incremental: step() can be called a few iterations at
+    a time (e.g. from a background task, see iter_steps), and sync()
+    picks up users and friendships added since, placing new users next
+    to their already-placed friends so the existing picture stays put
+    (warm start).
+
+    graph may also be a CSRGraph snapshot (Graph.freeze()). Background
+    runs should use one, with the stored positions passed in, so the
+    live Graph is never read off the UI thread.
+    """
+
+    def __init__(
+        self,
+        graph: Graph | CSRGraph,
+        positions: Optional[Dict[str, Point]] = None,
+        edge_length: float = EDGE_LENGTH,
+        seed: int = 0,
+    ) -> None:
+        self.graph = graph
+        self.k = edge_length
+        self.temperature = edge_length
+        self._rng = random.Random(seed)
+
+        self.names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.xs = array("d")
+        self.ys = array("d")
+        self.edges: List[Tuple[int, int]] = []
+
+        if positions is None:
+            positions = graph.get_positions() if isinstance(graph, Graph) else {}
+        self.sync(positions)
+
+    # -----------------------------------------------------------------
+    # Graph changes (warm start)
+    # -----------------------------------------------------------------
+    def sync(self, known: Optional[Dict[str, Point]] = None) -> int:
+        """
+        Match the layout to the graph's current users and friendships.
+        Users keep their position; new users start at known[name] if
+        given, else next to the centroid of their placed friends, else
+        at a random spot. Returns the number of users placed.
+        """
+        known = known or {}
+        old = {name: (self.xs[i], self.ys[i]) for name, i in self.index.items()}
+        users = sorted(self.graph.get_all_users())
+        spread = self.k * math.sqrt(max(len(users), 1))
+
+        self.names = users
+        self.index = {name: i for i, name in enumerate(users)}
+        self.xs = array("d", bytes(8 * len(users)))
+        self.ys = array("d", bytes(8 * len(users)))
+
+        placed = [False] * len(users)
+        pending = []
+        for i, name in enumerate(users):
+            pos = old.get(name) or known.get(name)
+            if pos is not None:
+                self.xs[i], self.ys[i] = pos
+                placed[i] = True
+            else:
+                pending.append(i)
+
+        # new users start next to their placed friends (including users
+        # placed earlier in this loop)
+        rng = self._rng
+        for i in pending:
+            sx = sy = 0.0
+            count = 0
+            for friend in self.graph.get_friends(users[i]):
+                j = self.index[friend]
+                if placed[j]:
+                    sx += self.xs[j]
+                    sy += self.ys[j]
+                    count += 1
+            if count:
+                angle = rng.uniform(0, 2 * math.pi)
+                self.xs[i] = sx / count + self.k / 2 * math.cos(angle)
+                self.ys[i] = sy / count + self.k / 2 * math.sin(angle)
+            else:
+                self.xs[i] = rng.uniform(-spread, spread)
+                self.ys[i] = rng.uniform(-spread, spread)
+            placed[i] = True
+
+        self.edges = [
+            (i, self.index[friend])
+            for i, name in enumerate(users)
+            for friend in self.graph.get_friends(name)
+            if self.index[friend] > i
+        ]
+
+        if pending and len(pending) < len(users):
+            # warm start: only a gentle re-settle around the newcomers
+            self.temperature = max(self.temperature, self.k / 4)
+        elif pending:
+            self.temperature = self.k
+        return len(pending)
+
+    # -----------------------------------------------------------------
+    # Iteration
+    # -----------------------------------------------------------------
+    def step(self, iterations: int = 1) -> float:
+        """
+        Run iterations of the simulation; returns the largest move of
+        the last iteration (0 when settled).
+        """
+        largest = 0.0
+        for _ in range(iterations):
+            largest = self._iterate()
+        return largest
+
+    def _iterate(self) -> float:
+        n = len(self.names)
+        if n == 0:
+            return 0.0
+
+        xs, ys = self.xs, self.ys
+        k = self.k
+        k2 = k * k
+        theta2 = THETA * THETA
+
+        tree = _QuadTree(xs, ys)
+        fx = array("d", bytes(8 * n))
+        fy = array("d", bytes(8 * n))
+
+        for i in range(n):
+            rx, ry = tree.repulsion(i, k2, theta2)
+            fx[i] = rx - GRAVITY * xs[i]
+            fy[i] = ry - GRAVITY * ys[i]
+
+        for i, j in self.edges:
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            d = math.hypot(dx, dy)
+            if d > 0:
+                f = d / k          # (d^2 / k) / d
+                fx[i] -= dx * f
+                fy[i] -= dy * f
+                fx[j] += dx * f
+                fy[j] += dy * f
+
+        t = self.temperature
+        largest = 0.0
+        for i in range(n):
+            f = math.hypot(fx[i], fy[i])
+            if f > 0:
+                move = min(f, t)
+                xs[i] += fx[i] / f * move
+                ys[i] += fy[i] / f * move
+                largest = max(largest, move)
+
+        self.temperature = max(t * COOLING, MIN_STEP)
+        return largest
+
+    def iter_steps(
+        self,
+        iterations: int = 200,
+        batch: int = 10,
+        tolerance: float = 1.0,
+    ) -> Iterator[Dict[str, Point]]:
+        """
+        Generator for background runs: yields a positions snapshot every
+        batch iterations (so a canvas can redraw progressively) and stops
+        early once no user moves more than tolerance.
+        """
+        done = 0
+        while done < iterations:
+            count = min(batch, iterations - done)
+            largest = self.step(count)
+            done += count
+            yield self.positions()
+            if largest < tolerance:
+                return
+
+    def run(self, iterations: int = 200, tolerance: float = 1.0) -> Dict[str, Point]:
+        for _ in self.iter_steps(iterations, tolerance=tolerance):
+            pass
+        return self.positions()
+
+    def positions(self) -> Dict[str, Point]:
+        xs, ys = self.xs, self.ys
+        return {name: (xs[i], ys[i]) for i, name in enumerate(self.names)}
+
+
+def layout_graph(graph: Graph, iterations: int = 200, save: bool = True) -> Dict[str, Point]:
+    """
+    Lay out graph starting from its stored positions (if any) and, with
+    save=True, store the result back with graph.set_positions() so it is
+    persisted by the next save/checkpoint.
+    """
+    positions = ForceLayout(graph).run(iterations)
+    if save:
+        graph.set_positions(positions)
+    return positions
@@ -0,0 +1,82 @@
+# social_graph/mutation_log.py
+
+import json
+import os
+from typing import Iterator, List
+
+
+# Operations a Graph records; replaying them in order rebuilds the graph.
+LOGGED_OPS = ("add_user", "add_friendship", "remove_friendship", "delete_user")
+
+
+class MutationLog:
+    """
+    Append-only log of graph mutations, one JSON record per line:
+
+        ["add_friendship", "Alice", "Bob"]
+
+    Each append is a single short write, so saving after an edit is O(1)
+    instead of rewriting the whole graph file.
+    """
+
+    def __init__(self, path: str, fsync: bool = False) -> None:
+        self.path = path
+        self.fsync = fsync
+        # records in the file, including those left by earlier sessions
+        self.records = _drop_torn_tail(path)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def append(self, op: str, *args: str) -> None:
+        self._file.write(json.dumps([op, *args]) + "\n")
+        self.records += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def _drop_torn_tail(path: str, block: int = 1 << 16) -> int:
+    # Cut a partial last record left by a crash so new records start on
+    # a fresh line. Returns the number of complete records kept.
+    if not os.path.exists(path):
+        return 0
+
+    records = 0
+    keep = 0
+    with open(path, "rb+") as f:
+        pos = 0
+        while True:
+            chunk = f.read(block)
+            if not chunk:
+                break
+            newlines = chunk.count(b"\n")
+            if newlines:
+                records += newlines
+                keep = pos + chunk.rfind(b"\n") + 1
+            pos += len(chunk)
+        if keep != pos:
+            f.truncate(keep)
+    return records
+
+
+def read_log(path: str) -> Iterator[List[str]]:
+    """
+    Yield the records of a log file in order. A torn last line (crash in
+    the middle of a write) is ignored; nothing after it can exist.
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                return
+            record = json.loads(line)
+            if record and record[0] in LOGGED_OPS:
+                yield record
@@ -0,0 +1,162 @@
+# social_graph/parallel.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .bfs import csr_distances
+from .csr import CSRGraph
+from .graph import Graph
+
+
+# =====================================================================
+# Result Container
+# =====================================================================
+class DistanceStats:
+    def __init__(
+        self,
+        histograms: Dict[str, List[int]],
+        time_ms: float = 0.0,
+    ):
+        # histograms[source][d] = number of users exactly d hops away
+        self.histograms = histograms
+        self.time_ms = time_ms
+
+        self.eccentricity = {
+            src: len(hist) - 1 for src, hist in histograms.items()
+        }
+        total: List[int] = []
+        for hist in histograms.values():
+            if len(hist) > len(total):
+                total.extend([0] * (len(hist) - len(total)))
+            for d, count in enumerate(hist):
+                total[d] += count
+        self.total_histogram = total
+
+    @property
+    def diameter(self) -> int:
+        # Largest eccentricity among the sampled sources (within components)
+        return max(self.eccentricity.values(), default=0)
+
+    @property
+    def average_separation(self) -> float:
+        # Mean hop distance over all reachable (source, user) pairs
+        pairs = sum(self.total_histogram[1:])
+        if pairs == 0:
+            return 0.0
+        hops = sum(d * c for d, c in enumerate(self.total_histogram))
+        return hops / pairs
+
+
+# =====================================================================
+# WORKER SIDE (runs in pool processes)
+# =====================================================================
+_worker_state: Dict[str, object] = {}
+
+
+def _attach(name: str):
+    # Pool workers share the parent's resource tracker, which keeps one
+    # entry per block name, so the parent's unlink() is the only cleanup.
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(offsets_name: str, targets_name: str, n: int, m: int) -> None:
+    offsets_shm = _attach(offsets_name)
+    targets_shm = _attach(targets_name)
+    _worker_state["shm"] = (offsets_shm, targets_shm)
+    _worker_state["offsets"] = offsets_shm.buf[:4 * (n + 1)].cast("i")
+    _worker_state["targets"] = targets_shm.buf[:4 * m].cast("i")
+
+
+def _histograms_for(sources: List[int]) -> List[Tuple[int, List[int]]]:
+    return _source_histograms(
+        _worker_state["offsets"], _worker_state["targets"], sources
+    )
+
+
+def _source_histograms(offsets, targets, sources: List[int]) -> List[Tuple[int, List[int]]]:
+    results = []
+    for source in sources:
+        hist: List[int] = []
+        for d in csr_distances(offsets, targets, source):
+            if d >= 0:
+                if d >= len(hist):
+                    hist.extend([0] * (d + 1 - len(hist)))
+                hist[d] += 1
+        results.append((source, hist))
+    return results
+
+
+# =====================================================================
+# PUBLIC API
+# =====================================================================
+def distance_histograms(
+    graph: Graph | CSRGraph,
+    sources: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+) -> DistanceStats:
+    """
+    Per-source hop-distance histograms for many sources, in parallel.
+
+    The graph is frozen to CSR once and its offsets/neighbor arrays are
+    copied into multiprocessing.shared_memory blocks; pool workers
+    attach to those blocks instead of receiving a pickled Graph, so each
+    task only ships a list of source ids. Sources are sharded across a
+    ProcessPoolExecutor in chunks of chunk_size and every worker runs
+    the direction-optimizing BFS (bfs.csr_distances).
+
+    Parameters:
+        graph      : Graph or CSRGraph
+        sources    : source usernames; None → every user
+        workers    : pool size; None → os.cpu_count(), 1 → no pool
+        chunk_size : sources per task
+
+    Returns:
+        DistanceStats (histograms, eccentricity, average separation, ...)
+    """
+
+    start_time = perf_counter()
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    if sources is None:
+        sources = csr.get_all_users()
+    source_ids = [csr.get_user_id(s) for s in sources if csr.has_user(s)]
+
+    workers = workers or os.cpu_count() or 1
+    n = csr.num_ids()
+    m = len(csr.targets)
+
+    if workers == 1 or len(source_ids) <= chunk_size:
+        pairs = _source_histograms(csr.offsets, memoryview(csr.targets), source_ids)
+    else:
+        offsets_shm = shared_memory.SharedMemory(create=True, size=4 * (n + 1))
+        targets_shm = shared_memory.SharedMemory(create=True, size=max(4 * m, 4))
+        try:
+            offsets_shm.buf[:4 * (n + 1)] = memoryview(csr.offsets).cast("B")
+            if m:
+                targets_shm.buf[:4 * m] = memoryview(csr.targets).cast("B")
+
+            chunks = [
+                source_ids[i:i + chunk_size]
+                for i in range(0, len(source_ids), chunk_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(offsets_shm.name, targets_shm.name, n, m),
+            ) as pool:
+                pairs = [p for chunk in pool.map(_histograms_for, chunks) for p in chunk]
+        finally:
+            offsets_shm.close()
+            offsets_shm.unlink()
+            targets_shm.close()
+            targets_shm.unlink()
+
+    get_name = csr.get_user_name
+    histograms = {get_name(source): hist for source, hist in pairs}
+
+    elapsed = (perf_counter() - start_time) * 1000
+    return DistanceStats(histograms, elapsed)
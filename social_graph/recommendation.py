@@ -1,24 +1,31 @@
+import heapq
+from array import array
 from collections import Counter
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+from .bfs import bfs_multi_source
+from .csr import CSRGraph
 from .graph import Graph
 
 # Recommend friends based on mutual friends
-def recommend_friends(graph: Graph, username: str, max_results: int = 5) -> List[Tuple[str, int]]:
+def recommend_friends(graph: Graph | CSRGraph, username: str, max_results: int = 5) -> List[Tuple[str, int]]:
     # Returns a list of tuples: [(recommended_user, mutual_friend_count)]
 
     if not graph.has_user(username):
         return[]
     
-    # current friends of user
-    direct_friends = set(graph.get_friends(username))
+    uid = graph.get_user_id(username)
+    get_neighbors = graph.get_neighbors
+    get_name = graph.get_user_name
+
+    # current friends of user (internal ids)
+    direct_friends = set(get_neighbors(uid))
 
     # mutual friends
-    mutual_counts: Counter[str] = Counter()
+    mutual_counts: Counter[int] = Counter()
 
     for friend in direct_friends:
-        friends_of_friend = graph.get_friends(friend)
-        for canditate in friends_of_friend:
-            if canditate == username:
+        for canditate in get_neighbors(friend):
+            if canditate == uid:
                 continue
             if canditate in direct_friends:
                 continue
@@ -26,8 +33,139 @@ def recommend_friends(graph: Graph, username: str, max_results: int = 5) -> List
 
     # Sort by highest mutual friends, then alphabetically
     sorted_candidates = sorted(
-        mutual_counts.items(),
+        ((get_name(c), count) for c, count in mutual_counts.items()),
         key = lambda item: (-item[1], item[0])
     )
 
-    return sorted_candidates[:max_results]
\ No newline at end of file
+    return sorted_candidates[:max_results]
+
+
+# Recommend friends for many users at once (nightly batch)
+def recommend_friends_batch(
+    graph: Graph | CSRGraph,
+    usernames: Optional[Iterable[str]] = None,
+    max_results: int = 5,
+) -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Mutual-friend recommendations for a whole list of users in one call.
+
+    Equivalent to calling recommend_friends for each user, but computed as
+    the sparse product A·A over the graph's CSR arrays, masked by A and
+    the identity (so existing friends and the user are skipped). Rows are
+    multiplied one at a time with a dense accumulator that is reused
+    across users, and top-k is taken with a heap instead of a full sort.
+
+    Parameters:
+        graph       : Graph (frozen internally) or an existing CSRGraph
+        usernames   : users to score; None → every user
+        max_results : recommendations kept per user
+
+    Returns:
+        {username: [(recommended_user, mutual_friend_count), ...]}
+    """
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    if usernames is None:
+        usernames = csr.get_all_users()
+
+    row_of = csr.get_neighbors
+    get_name = csr.get_user_name
+
+    n = csr.num_ids()
+    counts = array("i", bytes(4 * n))  # accumulator for one row of A·A
+    mask = array("i", bytes(4 * n))    # mask[x] == tag → x is user or friend
+
+    results: Dict[str, List[Tuple[str, int]]] = {}
+
+    for tag, username in enumerate(usernames, 1):
+        if not csr.has_user(username):
+            results[username] = []
+            continue
+
+        uid = csr.get_user_id(username)
+        friends = row_of(uid)
+
+        mask[uid] = tag
+        for f in friends:
+            mask[f] = tag
+
+        touched: List[int] = []
+        for f in friends:
+            for c in row_of(f):
+                if mask[c] != tag:
+                    if not counts[c]:
+                        touched.append(c)
+                    counts[c] += 1
+
+        # Highest mutual count first, then alphabetically
+        top = heapq.nsmallest(
+            max_results, ((-counts[c], get_name(c)) for c in touched)
+        )
+        for c in touched:
+            counts[c] = 0
+
+        results[username] = [(name, -neg) for neg, name in top]
+
+    return results
+
+
+
+# Score every non-friend by mutual friends and network distance
+MUTUAL_WEIGHT = 0.7
+DISTANCE_WEIGHT = 0.3
+
+
+def rank_recommendations(
+    graph: Graph | CSRGraph,
+    username: str,
+    max_results: Optional[int] = None,
+) -> List[Tuple[str, float, int, Optional[int]]]:
+    """
+    Rank every user who is not yet a friend of username.
+
+        score = 0.7 * mutual_friends + 0.3 * 1 / (1 + distance)
+
+    (distance score is 0 for unreachable users). One BFS gives the
+    distances to everyone, one pass over 2-hop neighbors gives the mutual
+    counts, and the top max_results are picked with a heap
+    (None → all candidates, best first).
+
+    Returns:
+        [(user, score, mutual_count, distance or None), ...]
+    """
+
+    if not graph.has_user(username):
+        return []
+
+    uid = graph.get_user_id(username)
+    iter_neighbors = graph.iter_neighbors
+    get_name = graph.get_user_name
+
+    friends = set(iter_neighbors(uid))
+
+    # mutual friend counts from the 2-hop neighborhood
+    mutual_counts: Counter[int] = Counter()
+    for friend in friends:
+        for candidate in iter_neighbors(friend):
+            if candidate != uid and candidate not in friends:
+                mutual_counts[candidate] += 1
+
+    distances = bfs_multi_source(graph, [username], deterministic=False).distances
+
+    def scored():
+        for name in graph.get_all_users():
+            other = graph.get_user_id(name)
+            if other == uid or other in friends:
+                continue
+            mutual = mutual_counts.get(other, 0)
+            distance = distances.get(other)
+            distance_score = 0 if distance is None else 1 / (1 + distance)
+            score = (mutual * MUTUAL_WEIGHT) + (distance_score * DISTANCE_WEIGHT)
+            yield (name, score, mutual, distance)
+
+    # Highest score first, then alphabetically
+    rank_key = lambda item: (-item[1], item[0])
+    if max_results is None:
+        return sorted(scored(), key=rank_key)
+    return heapq.nsmallest(max_results, scored(), key=rank_key)
+
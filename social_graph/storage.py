@@ -0,0 +1,118 @@
+# social_graph/storage.py
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import List, Optional, Sequence
+
+from .csr import CSRGraph
+
+
+# =====================================================================
+# BINARY GRAPH FORMAT (.sgx)
+# =====================================================================
+#
+#   header        magic "SGX1", byte order flag, n_ids, n_targets, name_bytes
+#   name_offsets  uint32[n_ids + 1]   → name i is blob[off[i]:off[i + 1]]
+#   name_blob     UTF-8 bytes, padded to a multiple of 4
+#   offsets       int32[n_ids + 1]    (CSR row offsets)
+#   targets       int32[n_targets]    (neighbor ids, rows in username order)
+#
+# An empty name marks a tombstoned id. Every section is 4-byte aligned so
+# the int arrays can be used straight out of an mmap without copying.
+
+BINARY_SUFFIX = ".sgx"
+MAGIC = b"SGX1"
+HEADER = struct.Struct("<4sB3xIII")
+_NATIVE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+def write_binary(
+    path: str,
+    names: Sequence[Optional[str]],
+    rows,
+) -> None:
+    """
+    Write a graph in the binary format.
+
+    names[uid] is the username of uid (None for a tombstone) and rows[uid]
+    its neighbor ids, already ordered by username.
+    """
+    name_offsets = array("I", [0])
+    blob = bytearray()
+    for name in names:
+        if name is not None:
+            blob += name.encode("utf-8")
+        name_offsets.append(len(blob))
+    blob += b"\0" * (-len(blob) % 4)
+
+    offsets = array("i", [0])
+    targets = array("i")
+    for row in rows:
+        targets.extend(row)
+        offsets.append(len(targets))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, _NATIVE_ORDER, len(names), len(targets), name_offsets[-1]))
+        f.write(name_offsets.tobytes())
+        f.write(blob)
+        f.write(offsets.tobytes())
+        f.write(targets.tobytes())
+
+
+def write_csr(path: str, csr: CSRGraph) -> None:
+    n = csr.num_ids()
+    write_binary(
+        path,
+        [csr.get_user_name(uid) for uid in range(n)],
+        (csr.get_neighbors(uid) for uid in range(n)),
+    )
+
+
+def open_binary(path: str) -> CSRGraph:
+    """
+    Open a binary graph file as a read-only CSRGraph.
+
+    The file is memory-mapped: offsets and neighbor ids are read directly
+    from the mapping (zero-copy), only the name table is decoded. Files
+    written on a machine with the other byte order are copied and
+    byte-swapped instead.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, order, n, m, name_bytes = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a social graph binary file.")
+
+    view = memoryview(mm)
+    pos = HEADER.size
+
+    def section(itemsize: int, count: int, code: str):
+        nonlocal pos
+        raw = view[pos:pos + itemsize * count]
+        pos += itemsize * count
+        if order == _NATIVE_ORDER:
+            return raw.cast(code)
+        swapped = array(code, raw.tobytes())
+        swapped.byteswap()
+        return swapped
+
+    name_offsets = section(4, n + 1, "I")
+    blob = view[pos:pos + name_bytes]
+    pos += name_bytes + (-name_bytes % 4)
+
+    names: List[Optional[str]] = []
+    for i in range(n):
+        start, end = name_offsets[i], name_offsets[i + 1]
+        names.append(str(blob[start:end], "utf-8") if end > start else None)
+
+    offsets = section(4, n + 1, "i")
+    targets = section(4, m, "i")
+
+    return CSRGraph(names, offsets, targets)
+
+
+def is_binary_path(path: str) -> bool:
+    return path.endswith(BINARY_SUFFIX)
@@ -0,0 +1,64 @@
+import random
+
+from gui.animation import (
+    FRONTIER, PATH, VISITED, Timeline, chunk_bounds, frame_size, level_bounds,
+)
+from social_graph.bfs import bfs_shortest_path
+from social_graph.graph import Graph
+
+
+def test_level_bounds_follow_bfs_levels():
+    g = Graph()
+    for a, b in [("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("E", "F")]:
+        g.add_friendship(a, b)
+    result = bfs_shortest_path(g, "A", "F")
+    levels = [result.distances.get(u) for u in result.visited_order]
+
+    bounds = level_bounds(levels)
+    frames = [result.visited_order[s:e] for s, e in zip(bounds, bounds[1:])]
+    assert frames == [["A"], ["B", "C"], ["D", "E"], ["F"]]
+
+    # large levels are split
+    assert level_bounds([0, 1, 1, 1, 1, 1, 2], max_size=2) == [0, 1, 3, 5, 6, 7]
+    assert chunk_bounds(5, 2) == [0, 2, 4, 5]
+    assert frame_size(1000, 240) == 5
+
+
+def test_timeline_step_matches_classic_animation():
+    # one node per frame: current node is the frontier, earlier ones visited
+    t = Timeline(["A", "B", "C"], chunk_bounds(3, 1), ["A", "C"])
+    assert t.last_frame == 5
+
+    state = t.state(2)
+    assert [t.color(n, state) for n in "ABC"] == [VISITED, FRONTIER, None]
+    state = t.state(5)
+    assert [t.color(n, state) for n in "ABC"] == [PATH, VISITED, PATH]
+
+    assert t.diff(1, 2) == {VISITED: ["A"], FRONTIER: ["B"]}
+    assert t.diff(2, 0) == {None: ["A", "B"]}
+
+
+def test_seek_diffs_reproduce_every_frame():
+    rng = random.Random(3)
+    order = [rng.randrange(40) for _ in range(120)]   # DFS-style re-entries
+    path = rng.sample(range(40), 6)
+    t = Timeline(order, chunk_bounds(len(order), 7), path, 2)
+
+    shown = {}
+    frame = 0
+    for target in [rng.randrange(t.last_frame + 1) for _ in range(60)] + [t.last_frame, 0]:
+        for color, nodes in t.diff(frame, target).items():
+            for node in nodes:
+                if color is None:
+                    shown.pop(node, None)
+                else:
+                    shown[node] = color
+        frame = target
+
+        state = t.state(frame)
+        expected = {}
+        for node in set(order) | set(path):
+            color = t.color(node, state)
+            if color is not None:
+                expected[node] = color
+        assert shown == expected
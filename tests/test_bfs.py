@@ -33,3 +33,139 @@ def test_bfs_same_node():
 
     result = bfs_shortest_path(g, "A", "A")
     assert result.path == ["A"]
+
+
+def test_bfs_bidirectional_matches_path_length():
+    import random
+
+    rng = random.Random(7)
+    g = Graph()
+    for i in range(60):
+        g.add_user(f"U{i}")
+    for _ in range(90):
+        g.add_friendship(f"U{rng.randrange(60)}", f"U{rng.randrange(60)}")
+
+    for _ in range(40):
+        s, t = f"U{rng.randrange(60)}", f"U{rng.randrange(60)}"
+        plain = bfs_shortest_path(g, s, t)
+        both = bfs_shortest_path(g, s, t, bidirectional=True)
+
+        assert len(both.path) == len(plain.path)
+        assert both.reachable == plain.reachable
+        for a, b in zip(both.path, both.path[1:]):
+            assert g.are_friends(a, b)
+        if both.path:
+            assert both.path[0] == s and both.path[-1] == t
+            assert both.distances[t] == len(both.path) - 1
+
+
+def test_bfs_bidirectional_no_path():
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.add_friendship("C", "D")
+
+    result = bfs_shortest_path(g, "A", "D", bidirectional=True)
+    assert result.path == []
+    assert result.reachable is False
+    assert bfs_shortest_path(g, "A", "B", return_full_result=False, bidirectional=True) == ["A", "B"]
+
+
+def test_bfs_multi_source_depth_and_nearest_seed():
+    from social_graph.bfs import bfs_multi_source, k_hop_neighborhood
+
+    g = Graph()
+    # chain A - B - C - D - E - F, plus isolated Z
+    for u, v in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("E", "F")]:
+        g.add_friendship(u, v)
+    g.add_user("Z")
+
+    result = bfs_multi_source(g, ["A", "F", "Ghost"], named=True)
+    assert result.distances == {"A": 0, "F": 0, "B": 1, "E": 1, "C": 2, "D": 2}
+    assert result.nearest_source["C"] == "A"
+    assert result.nearest_source["D"] == "F"
+
+    bounded = bfs_multi_source(g, ["A"], max_depth=2)
+    assert set(bounded.distances) == {g.get_user_id(u) for u in "ABC"}
+
+    assert sorted(k_hop_neighborhood(g, ["C"], 1)) == ["B", "D"]
+    assert sorted(k_hop_neighborhood(g, ["C", "Z"], 2, include_sources=True)) == \
+        ["A", "B", "C", "D", "E", "Z"]
+
+
+def test_bfs_result_named_views_are_lazy():
+    g = Graph()
+    for u, v in [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")]:
+        g.add_friendship(u, v)
+
+    result = bfs_shortest_path(g, "A", "D")
+
+    assert not hasattr(result, "__dict__")
+    assert result._visited_order is None and result._distances is None
+    assert result.path == ["A", "B", "D"]
+    assert result.visited_order == ["A", "B", "C", "D"]
+    assert result.distances == {"A": 0, "B": 1, "C": 1, "D": 2}
+    assert result.exploration_tree == {"A": None, "B": "A", "C": "A", "D": "B"}
+    assert result.to_dict()["reachable"] is True
+
+
+def views(result):
+    return result.visited_order, result.distances, result.exploration_tree
+
+
+def test_bfs_result_views_survive_later_renumbering():
+    for bidirectional in (False, True):
+        g = Graph()
+        for u, v in [("X", "Y"), ("A", "B"), ("B", "C"), ("C", "D")]:
+            g.add_friendship(u, v)
+
+        result = bfs_shortest_path(g, "A", "D", bidirectional=bidirectional)
+        probe = bfs_shortest_path(g, "B", "D")
+        expected = [views(r) for r in (
+            bfs_shortest_path(g, "A", "D", bidirectional=bidirectional),
+            bfs_shortest_path(g, "B", "D"),
+        )]
+
+        # renumber ids and add a user before the views are first read
+        g.delete_user("X")
+        g.compact(0)
+        g.add_user("Z")
+
+        assert [views(result), views(probe)] == expected
+        assert "Z" not in result.visited_order and "Z" not in probe.visited_order
+
+
+def test_name_table_is_shared_until_a_name_changes():
+    g = Graph()
+    g.add_friendship("A", "B")
+    table = g.name_table()
+
+    g.add_friendship("B", "C")      # new ids are appended: no copy
+    g.remove_friendship("A", "B")
+    assert g.name_table() is table
+
+    g.delete_user("A")              # id 0 retired: copied first
+    assert table[0] == "A"
+    assert g.name_table() is not table and g.name_table()[0] is None
+
+
+def test_bfs_distances_matches_queue_bfs():
+    import random
+    from social_graph.bfs import bfs_distances, bfs_multi_source
+
+    rng = random.Random(4)
+    for n_users, n_edges in [(200, 150), (200, 4000)]:   # sparse and dense
+        g = Graph()
+        for i in range(n_users):
+            g.add_user(f"U{i}")
+        for _ in range(n_edges):
+            g.add_friendship(f"U{rng.randrange(n_users)}", f"U{rng.randrange(n_users)}")
+        g.delete_user("U7")   # tombstoned id must stay at -1
+
+        dist = bfs_distances(g, "U0")
+        expected = bfs_multi_source(g, ["U0"]).distances
+
+        assert len(dist) == g.num_ids()
+        for uid in range(g.num_ids()):
+            assert dist[uid] == expected.get(uid, -1)
+
+    assert list(bfs_distances(g, "Ghost")) == [-1] * g.num_ids()
@@ -0,0 +1,131 @@
+import random
+
+from social_graph.graph import Graph
+from social_graph.bfs import bfs_shortest_path
+from social_graph.dfs import dfs_shortest_path, dfs_traversal
+from social_graph.recommendation import rank_recommendations, recommend_friends
+from social_graph.cache import QueryCache
+
+
+def build_graph():
+    g = Graph()
+    g.add_friendship("Alice", "Bob")
+    g.add_friendship("Bob", "Charlie")
+    g.add_friendship("Charlie", "David")
+    return g
+
+
+def test_repeated_queries_hit_until_graph_changes():
+    g = build_graph()
+    cache = QueryCache(g)
+
+    first = cache.bfs_shortest_path("Alice", "David")
+    assert cache.bfs_shortest_path("Alice", "David") is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    version = g.version
+    g.add_friendship("Alice", "David")
+    assert g.version > version
+
+    fresh = cache.bfs_shortest_path("Alice", "David")
+    assert fresh.path == ["Alice", "David"]
+    assert fresh.path == bfs_shortest_path(g, "Alice", "David").path
+    assert cache.misses == 2
+
+
+def test_no_op_mutations_keep_entries():
+    g = build_graph()
+    cache = QueryCache(g)
+    cache.recommend_friends("Alice")
+
+    g.add_friendship("Alice", "Bob")      # already friends
+    g.remove_friendship("Alice", "David") # not friends
+    cache.recommend_friends("Alice")
+
+    assert cache.hits == 1
+
+
+def test_lru_bound_and_options_in_key():
+    g = build_graph()
+    cache = QueryCache(g, max_entries=2)
+
+    cache.dfs_traversal("Alice")
+    cache.dfs_traversal("Alice", return_full=False)
+    cache.dfs_traversal("Bob")
+    assert len(cache) == 2
+
+    cache.dfs_traversal("Alice")          # evicted → recomputed
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_edits_elsewhere_keep_entries():
+    g = build_graph()
+    g.add_friendship("Xavier", "Yara")
+    cache = QueryCache(g)
+
+    cache.bfs_shortest_path("Alice", "Charlie")
+    cache.rank_recommendations("Alice")
+    cache.dfs_traversal("Bob")
+
+    g.add_friendship("Yara", "Zoe")        # new user → rankings change
+    g.remove_friendship("Xavier", "Yara")
+    g.add_friendship("David", "Eve")       # outside the searched part
+
+    cache.bfs_shortest_path("Alice", "Charlie")
+    cache.dfs_traversal("Bob")
+    assert cache.rank_recommendations("Alice") == \
+        QueryCache(g).rank_recommendations("Alice")
+    assert cache.hits == 1                 # only the short BFS survived
+
+
+def test_merge_invalidates_community_entries():
+    g = build_graph()
+    g.add_friendship("Xavier", "Yara")
+    cache = QueryCache(g)
+
+    cache.dfs_traversal("Xavier")
+    g.add_friendship("Yara", "David")      # Xavier's community is absorbed
+
+    assert cache.dfs_traversal("Xavier").order == \
+        ["Xavier", "Yara", "David", "Charlie", "Bob", "Alice"]
+    assert cache.hits == 0
+
+
+def test_cached_results_match_fresh_under_random_edits():
+    rng = random.Random(5)
+    g = Graph()
+    names = [f"U{i}" for i in range(40)]
+    for _ in range(50):
+        g.add_friendship(rng.choice(names), rng.choice(names))
+    cache = QueryCache(g, max_entries=64)
+
+    for step in range(300):
+        a, b = rng.choice(names), rng.choice(names)
+        if step % 3 == 0:
+            g.add_friendship(a, b)
+        elif step % 3 == 1:
+            g.remove_friendship(a, b)
+        elif step % 30 == 2:
+            g.delete_user(a)
+
+        a, b = rng.choice(names), rng.choice(names)
+        cached, fresh = cache.bfs_shortest_path(a, b), bfs_shortest_path(g, a, b)
+        assert (cached.path, cached.visited_order) == (fresh.path, fresh.visited_order)
+        assert cache.dfs_shortest_path(a, b, return_full_result=False) == \
+            dfs_shortest_path(g, a, b, return_full_result=False)
+        assert cache.dfs_traversal(a).parent == dfs_traversal(g, a).parent
+        assert cache.recommend_friends(a) == recommend_friends(g, a)
+        assert cache.rank_recommendations(a, 5) == rank_recommendations(g, a, 5)
+
+    assert cache.hits > 0
+
+
+def test_close_detaches_cache_from_graph():
+    g = build_graph()
+    cache = QueryCache(g)
+    assert cache._on_mutation in g._listeners
+
+    cache.bfs_shortest_path("Alice", "David")
+    cache.close()
+    assert cache._on_mutation not in g._listeners
+    assert len(cache) == 0
@@ -0,0 +1,103 @@
+import random
+
+from social_graph.graph import Graph
+from social_graph.bfs import bfs_shortest_path
+
+
+def brute_force_count(g):
+    seen, count = set(), 0
+    for user in g.get_all_users():
+        if user in seen:
+            continue
+        count += 1
+        stack = [user]
+        seen.add(user)
+        while stack:
+            for friend in g.get_friends(stack.pop()):
+                if friend not in seen:
+                    seen.add(friend)
+                    stack.append(friend)
+    return count
+
+
+def test_community_index_tracks_mutations():
+    rng = random.Random(2)
+    g = Graph()
+    names = [f"U{i}" for i in range(30)]
+    for name in names:
+        g.add_user(name)
+
+    for step in range(300):
+        a, b = rng.choice(names), rng.choice(names)
+        roll = rng.random()
+        if roll < 0.6:
+            g.add_friendship(a, b)
+        elif roll < 0.9:
+            g.remove_friendship(a, b)
+        else:
+            g.delete_user(a)
+            g.add_user(a)
+
+        assert g.community_count() == brute_force_count(g)
+        if g.has_user(a) and g.has_user(b):
+            reachable = bfs_shortest_path(g, a, b).reachable
+            assert g.same_community(a, b) == reachable
+
+
+def test_communities_grouping():
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.add_friendship("B", "C")
+    g.add_friendship("D", "E")
+    g.add_user("F")
+
+    groups = [sorted(group) for group in g.communities()]
+
+    assert groups[0] == ["A", "B", "C"]
+    assert sorted(groups[1:]) == [["D", "E"], ["F"]]
+    assert g.component_of("A") == g.component_of("C")
+    assert g.component_of("A") != g.component_of("D")
+    assert not g.same_community("A", "Ghost")
+
+
+def test_unfriend_updates_index_without_rebuild():
+    g = Graph()
+    for u, v in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")]:
+        g.add_friendship(u, v)
+    index = g._communities
+
+    g.remove_friendship("A", "B")      # cycle edge: still one community
+    assert g.community_count() == 1
+    g.remove_friendship("C", "D")      # bridge: D splits off
+    assert g.community_count() == 2
+    assert not g.same_community("A", "D")
+    g.delete_user("C")                 # A and B split apart
+    assert g.community_count() == 3
+
+    assert g._communities is index
+
+
+def test_replay_component_counts_matches_online_graph():
+    from social_graph.connectivity import replay_component_counts
+
+    rng = random.Random(9)
+    names = [f"U{i}" for i in range(25)]
+    records = []
+    g = Graph()
+    expected = []
+    for _ in range(400):
+        a, b = rng.choice(names), rng.choice(names)
+        roll = rng.random()
+        if roll < 0.1:
+            record = ["add_user", a]
+        elif roll < 0.6:
+            record = ["add_friendship", a, b]
+        elif roll < 0.9:
+            record = ["remove_friendship", a, b]
+        else:
+            record = ["delete_user", a]
+        records.append(record)
+        getattr(g, record[0])(*record[1:])
+        expected.append(brute_force_count(g))
+
+    assert replay_component_counts(records) == expected
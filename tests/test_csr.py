@@ -0,0 +1,54 @@
+from social_graph.graph import Graph
+from social_graph.bfs import bfs_shortest_path
+from social_graph.dfs import dfs_traversal
+from social_graph.dfs_iterative import dfs_iterative
+from social_graph.recommendation import recommend_friends
+
+
+def build_sample():
+    g = Graph()
+    g.add_friendship("Alice", "Bob")
+    g.add_friendship("Alice", "Charlie")
+    g.add_friendship("Bob", "David")
+    g.add_friendship("Charlie", "David")
+    g.add_friendship("Charlie", "Eve")
+    g.add_user("Zed")
+    return g
+
+
+def test_freeze_keeps_ids_and_neighbors():
+    g = build_sample()
+    csr = g.freeze()
+
+    assert csr.num_ids() == g.num_ids()
+    assert csr.num_edges() == 5
+    for name in g.get_all_users():
+        uid = g.get_user_id(name)
+        assert csr.get_user_id(name) == uid
+        assert list(csr.sorted_neighbors(uid)) == g.sorted_neighbors(uid)
+        assert csr.get_friends(name) == g.get_friends(name)
+
+    assert csr.are_friends("Alice", "Bob")
+    assert not csr.are_friends("Alice", "Eve")
+    assert not csr.are_friends("Alice", "Nobody")
+
+
+def test_algorithms_match_on_frozen_graph():
+    g = build_sample()
+    csr = g.freeze()
+
+    assert bfs_shortest_path(csr, "Alice", "Eve").path == \
+        bfs_shortest_path(g, "Alice", "Eve").path
+    assert dfs_traversal(csr, "Alice").order == dfs_traversal(g, "Alice").order
+    assert dfs_iterative(csr, "Alice") == dfs_iterative(g, "Alice")
+    assert recommend_friends(csr, "Alice") == recommend_friends(g, "Alice")
+    assert recommend_friends(g, "Alice") == [("David", 2), ("Eve", 1)]
+
+
+def test_freeze_is_a_snapshot():
+    g = build_sample()
+    csr = g.freeze()
+    g.add_friendship("Alice", "Zed")
+
+    assert not csr.are_friends("Alice", "Zed")
+    assert csr.get_friends("Zed") == []
@@ -133,3 +133,61 @@ def test_dfs_timestamp_rules():
 
     # first node visited must have smallest tin
     assert tin["A"] == min(tin.values())
+
+
+# ------------------------------------------------------------------
+# DFS path finder (pruned iterative search)
+# ------------------------------------------------------------------
+def test_dfs_shortest_path_matches_bfs_length():
+    import random
+    from social_graph.bfs import bfs_shortest_path
+    from social_graph.dfs import dfs_shortest_path
+
+    rng = random.Random(3)
+    g = Graph()
+    for i in range(40):
+        g.add_user(f"U{i}")
+    for _ in range(120):
+        g.add_friendship(f"U{rng.randrange(40)}", f"U{rng.randrange(40)}")
+
+    for _ in range(30):
+        s, t = f"U{rng.randrange(40)}", f"U{rng.randrange(40)}"
+        result = dfs_shortest_path(g, s, t)
+        expected = bfs_shortest_path(g, s, t).path
+
+        assert len(result.path) == len(expected)
+        for a, b in zip(result.path, result.path[1:]):
+            assert g.are_friends(a, b)
+        if result.path:
+            assert set(result.path) <= set(result.visited_order)
+            assert result.visited_order[0] == s
+
+
+def test_dfs_shortest_path_long_chain_no_recursion_limit():
+    from social_graph.dfs import dfs_shortest_path
+
+    g = Graph()
+    n = 5000
+    for i in range(n - 1):
+        g.add_friendship(f"N{i}", f"N{i + 1}")
+
+    result = dfs_shortest_path(g, "N0", f"N{n - 1}")
+    assert len(result.path) == n
+    assert result.distances[f"N{n - 1}"] == n - 1
+
+
+# ------------------------------------------------------------------
+# Long chains must not hit the recursion limit
+# ------------------------------------------------------------------
+def test_dfs_long_chain():
+    g = Graph()
+    n = sys.getrecursionlimit() * 3
+    for i in range(n - 1):
+        g.add_friendship(f"N{i}", f"N{i + 1}")
+
+    result = dfs_traversal(g, "N0")
+
+    assert len(result.order) == n
+    assert result.depth[f"N{n - 1}"] == n - 1
+    assert result.tin["N0"] == 1
+    assert result.tout["N0"] == 2 * n
@@ -0,0 +1,47 @@
+from social_graph.dsu import ArrayDSU
+
+
+def test_array_dsu_sizes_and_count():
+    dsu = ArrayDSU(6)
+    assert dsu.count == 6
+
+    assert dsu.union(0, 1)
+    assert dsu.union(1, 2)
+    assert not dsu.union(0, 2)
+    assert dsu.union(4, 5)
+
+    assert dsu.count == 3
+    assert dsu.component_size(2) == 3
+    assert dsu.component_size(3) == 1
+    assert dsu.same(0, 2) and not dsu.same(0, 4)
+    assert list(dsu.labels()) == [0, 0, 0, 1, 2, 2]
+
+    x = dsu.add()
+    assert x == 6 and dsu.count == 4
+
+
+def depth(dsu, x):
+    steps = 0
+    while dsu.parent[x] != x:
+        x = dsu.parent[x]
+        steps += 1
+    return steps
+
+
+def test_array_dsu_long_chain():
+    # deep parent chains must not hit the recursion limit
+    n = 20000
+    fast = ArrayDSU(n)
+    for i in range(n - 1):
+        fast.parent[i] = i + 1          # one chain 0 → 1 → ... → n-1
+    fast.size[n - 1] = n
+    fast.count = 1
+    assert depth(fast, 0) == n - 1
+
+    assert fast.find(0) == n - 1
+    # path halving: every node on the path now skips its parent
+    assert depth(fast, 0) <= n // 2
+
+    assert fast.component_size(0) == n
+    assert len(set(fast.labels())) == 1
+    assert fast.find(n // 2) == n - 1
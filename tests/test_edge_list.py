@@ -0,0 +1,104 @@
+from social_graph.graph import Graph
+from social_graph.edge_list import load_edge_list_csr, read_edge_chunks
+
+
+EDGES = [
+    ("Alice", "Bob"),
+    ("Bob", "Alice"),        # duplicate in the other direction
+    ("Bob", "Charlie"),
+    ("Charlie", "Charlie"),  # self-loop
+    ("Dávid", "Alice"),
+    ("Eve", "Frank"),
+    ("Alice", "Bob"),
+]
+
+
+def expected_graph():
+    g = Graph()
+    for u, v in EDGES:
+        g.add_friendship(u, v)
+    return g
+
+
+def write_tsv(path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# exported friendships\n")
+        for u, v in EDGES:
+            f.write(f"{u}\t{v}\t1\n")
+
+
+def test_bulk_load_file_matches_add_friendship(tmp_path):
+    path = str(tmp_path / "edges.tsv")
+    write_tsv(path)
+
+    g = Graph()
+    added = g.bulk_load_edges(path, chunk_size=2)
+
+    expected = expected_graph()
+    assert added == 4
+    assert g.adjacency_list() == expected.adjacency_list()
+    for uid in range(g.num_ids()):
+        names = [g.get_user_name(n) for n in g.sorted_neighbors(uid)]
+        assert names == sorted(names)
+    assert g.community_count() == 2
+
+
+def test_bulk_load_into_existing_graph():
+    g = Graph()
+    g.add_friendship("Alice", "Zed")
+    g.add_user("Temp")
+    g.delete_user("Temp")    # free id is reused
+
+    g.bulk_load_edges([("user", "friend"), *EDGES], skip_header=True)
+
+    expected = expected_graph()
+    expected.add_friendship("Alice", "Zed")
+    assert g.adjacency_list() == expected.adjacency_list()
+    assert g.same_community("Zed", "Charlie")
+
+
+def test_bulk_load_failing_source_leaves_graph_consistent():
+    def rows():
+        yield ("a", "c")
+        yield ("a", "b")
+        raise ValueError("bad row")
+
+    g = Graph()
+    g.add_friendship("x", "y")
+    try:
+        g.bulk_load_edges(rows(), chunk_size=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("error was swallowed")
+
+    # edges read before the error are kept, with the derived state in line
+    assert g.get_friends("a") == ["b", "c"]
+    a = g.get_user_id("a")
+    assert [g.get_user_name(n) for n in g.sorted_neighbors(a)] == ["b", "c"]
+    assert g.community_count() == 2
+    assert sorted(map(sorted, g.communities())) == [["a", "b", "c"], ["x", "y"]]
+    g.remove_friendship("a", "b")
+    assert g.get_friends("a") == ["c"]
+
+
+def test_csv_chunks_and_header(tmp_path):
+    path = tmp_path / "edges.csv"
+    path.write_text("source,target\n A , B \nB,C\nC\n", encoding="utf-8")
+
+    chunks = list(read_edge_chunks(str(path), chunk_size=1, skip_header=True))
+
+    assert chunks == [[("A", "B")], [("B", "C")]]
+
+
+def test_csr_build_matches_freeze(tmp_path):
+    path = str(tmp_path / "edges.tsv")
+    write_tsv(path)
+
+    csr = load_edge_list_csr(path, chunk_size=3)
+    expected = expected_graph()
+
+    assert sorted(csr.get_all_users()) == sorted(expected.get_all_users())
+    assert csr.num_edges() == 4
+    for user in expected.get_all_users():
+        assert csr.get_friends(user) == expected.get_friends(user)
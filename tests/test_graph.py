@@ -10,5 +10,120 @@ def test():
     g.add_friendship("A", "B")
     print(g.print_adjacency_list())
 
+
+def test_sorted_neighbors_index_is_maintained():
+    g = Graph()
+    g.add_friendship("A", "D")
+    g.add_friendship("A", "B")
+    g.add_friendship("A", "C")
+    g.add_friendship("A", "B")  # duplicate is ignored
+
+    name = g.get_user_name
+    assert [name(n) for n in g.sorted_neighbors(g.get_user_id("A"))] == ["B", "C", "D"]
+
+    g.remove_friendship("A", "C")
+    assert [name(n) for n in g.sorted_neighbors(g.get_user_id("A"))] == ["B", "D"]
+
+    g.delete_user("B")
+    assert [name(n) for n in g.sorted_neighbors(g.get_user_id("A"))] == ["D"]
+    assert [name(n) for n in g.sorted_neighbors(g.get_user_id("D"))] == ["A"]
+
+
+def test_non_deterministic_traversals_cover_same_nodes():
+    from social_graph.bfs import bfs_shortest_path
+    from social_graph.dfs import dfs_traversal
+    from social_graph.dfs_iterative import dfs_iterative
+
+    g = Graph()
+    for u, v in [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D"), ("D", "E")]:
+        g.add_friendship(u, v)
+
+    fast = bfs_shortest_path(g, "A", "E", deterministic=False)
+    assert len(fast.path) == 4
+    assert set(dfs_traversal(g, "A", deterministic=False).order) == set("ABCDE")
+    assert set(dfs_iterative(g, "A", deterministic=False)) == set("ABCDE")
+
+
+def test_delete_user_tombstones_and_reuses_ids():
+    g = Graph()
+    for u, v in [("A", "B"), ("B", "C"), ("C", "D"), ("A", "D")]:
+        g.add_friendship(u, v)
+    a_id, d_id = g.get_user_id("A"), g.get_user_id("D")
+    b_id = g.get_user_id("B")
+
+    g.delete_user("B")
+
+    # other ids are untouched, B's id is free for the next user
+    assert g.get_user_id("A") == a_id and g.get_user_id("D") == d_id
+    assert not g.has_user("B")
+    assert g.get_friends("A") == ["D"]
+    assert g.get_friends("C") == ["D"]
+    assert g.users_in_order() == ["A", "C", "D"]
+    assert g.adjacency_matrix() == [[0, 0, 1], [0, 0, 1], [1, 1, 0]]
+
+    g.add_user("E")
+    assert g.get_user_id("E") == b_id
+    assert g.get_friends("E") == []
+
+
+def test_compact_renumbers_when_fragmented():
+    g = Graph()
+    names = [f"U{i}" for i in range(10)]
+    for a, b in zip(names, names[1:]):
+        g.add_friendship(a, b)
+
+    for name in names[:5]:
+        g.delete_user(name)
+    assert g.num_ids() == 10          # 50% tombstones: not yet compacted
+
+    g.delete_user("U5")               # crosses the threshold
+    assert g.num_ids() == 4
+    assert g.fragmentation() == 0.0
+    assert g.get_friends("U7") == ["U6", "U8"]
+    assert sorted(g.get_user_id(n) for n in names[6:]) == [0, 1, 2, 3]
+
+    g.delete_user("U9")
+    assert g.compact(threshold=0)
+    assert g.users_in_order() == ["U6", "U7", "U8"]
+
+
+def test_observer_receives_one_event_per_change():
+    from social_graph.graph import GraphObserver
+
+    class Recorder(GraphObserver):
+        def __init__(self):
+            self.events = []
+
+        def user_added(self, username):
+            self.events.append(("+user", username))
+
+        def user_removed(self, username):
+            self.events.append(("-user", username))
+
+        def friendship_added(self, u, v):
+            self.events.append(("+edge", u, v))
+
+        def friendship_removed(self, u, v):
+            self.events.append(("-edge", u, v))
+
+    g = Graph()
+    rec = Recorder()
+    g.add_listener(rec)
+
+    g.add_friendship("Alice", "Bob")
+    g.add_friendship("Alice", "Bob")      # no change → no event
+    g.add_friendship("Bob", "Charlie")
+    g.delete_user("Bob")
+    g.remove_listener(rec)
+    g.add_user("Zed")
+
+    assert rec.events == [
+        ("+user", "Alice"), ("+user", "Bob"), ("+edge", "Alice", "Bob"),
+        ("+user", "Charlie"), ("+edge", "Bob", "Charlie"),
+        ("-edge", "Bob", "Alice"), ("-edge", "Bob", "Charlie"),
+        ("-user", "Bob"),
+    ]
+
+
 if __name__ == "__main__":
     test()
@@ -0,0 +1,114 @@
+import math
+import random
+from array import array
+
+from social_graph.graph import Graph
+from social_graph.layout import THETA, ForceLayout, _QuadTree, layout_graph
+
+
+def two_triangles():
+    g = Graph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"),
+                 ("X", "Y"), ("Y", "Z"), ("Z", "X"), ("C", "X")]:
+        g.add_friendship(a, b)
+    return g
+
+
+def dist(p, q):
+    return math.hypot(p[0] - q[0], p[1] - q[1])
+
+
+def test_layout_separates_users_and_keeps_friends_close():
+    g = two_triangles()
+    pos = ForceLayout(g).run(300)
+
+    assert set(pos) == set(g.get_all_users())
+    for u in pos:
+        for v in pos:
+            if u < v:
+                assert dist(pos[u], pos[v]) > 20
+    # friends end up closer than the far ends of the two triangles
+    assert dist(pos["A"], pos["B"]) < dist(pos["A"], pos["Z"])
+
+
+def test_warm_start_keeps_existing_positions_stable():
+    g = two_triangles()
+    layout = ForceLayout(g)
+    before = layout.run(300)
+
+    g.add_friendship("A", "New")
+    assert layout.sync() == 1
+    after = layout.run(50)
+
+    assert dist(after["New"], after["A"]) < 2 * layout.k
+    for name, p in before.items():
+        assert dist(p, after[name]) < layout.k
+
+
+def test_positions_persist_with_json_save(tmp_path):
+    g = two_triangles()
+    positions = layout_graph(g, iterations=20)
+    g.delete_user("Z")
+    path = str(tmp_path / "graph.json")
+    g.save(path)
+
+    loaded = Graph()
+    loaded.load(path)
+
+    stored = loaded.get_positions()
+    assert set(stored) == set(positions) - {"Z"}
+    assert all(stored[u] == positions[u] for u in stored)
+
+
+def exact_repulsion(xs, ys, i, k2):
+    # net force and the sum of the individual force magnitudes
+    fx = fy = scale = 0.0
+    for j in range(len(xs)):
+        if j != i:
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            d2 = dx * dx + dy * dy
+            fx += dx / d2 * k2
+            fy += dy / d2 * k2
+            scale += k2 / math.sqrt(d2)
+    return fx, fy, scale
+
+
+def test_barnes_hut_matches_exact_repulsion():
+    rng = random.Random(1)
+
+    # a lone body in the corner of a cell whose mass sits in the far
+    # corner: with too large a theta the body feels its own cell
+    points = [(0.0, 0.0)] + [(100 - rng.random(), 100 - rng.random()) for _ in range(10)]
+    xs = array("d", [p[0] for p in points])
+    ys = array("d", [p[1] for p in points])
+    ex, ey, scale = exact_repulsion(xs, ys, 0, 100.0)
+    fx, fy = _QuadTree(xs, ys).repulsion(0, 100.0, THETA * THETA)
+    assert math.hypot(fx - ex, fy - ey) <= 0.01 * math.hypot(ex, ey)
+
+    points += [(rng.uniform(0, 400), rng.uniform(0, 400)) for _ in range(40)]
+    xs = array("d", [p[0] for p in points])
+    ys = array("d", [p[1] for p in points])
+    tree = _QuadTree(xs, ys)
+    for i in range(len(points)):
+        ex, ey, scale = exact_repulsion(xs, ys, i, 100.0)
+        fx, fy = tree.repulsion(i, 100.0, THETA * THETA)
+        assert math.hypot(fx - ex, fy - ey) <= 0.03 * scale
+
+        # theta 0 opens every cell: exact
+        fx, fy = tree.repulsion(i, 100.0, 0.0)
+        assert math.isclose(fx, ex, abs_tol=1e-9) and math.isclose(fy, ey, abs_tol=1e-9)
+
+
+def test_layout_runs_on_frozen_snapshot():
+    g = two_triangles()
+    layout_graph(g, iterations=50)
+    stored = g.get_positions()
+
+    snapshot = g.freeze()
+    g.add_friendship("A", "New")     # edits after the snapshot are not seen
+    layout = ForceLayout(snapshot, stored)
+    assert layout.names == sorted(snapshot.get_all_users())
+    assert layout.positions() == stored
+    layout.step(5)
+    assert "New" not in layout.positions()
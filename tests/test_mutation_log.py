@@ -0,0 +1,94 @@
+import os
+
+from social_graph.graph import Graph
+
+
+def test_log_replayed_on_load(tmp_path):
+    path = str(tmp_path / "graph.json")
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.save(path)
+
+    g.enable_log(path)
+    g.add_friendship("B", "C")
+    g.add_friendship("C", "D")
+    g.remove_friendship("A", "B")
+    g.delete_user("D")
+    g.sync()
+
+    restored = Graph()
+    restored.load(path)
+    assert restored.adjacency_list() == g.adjacency_list()
+    g.close_log()
+
+
+def test_checkpoint_folds_log_into_snapshot(tmp_path):
+    path = str(tmp_path / "graph.sgx")
+    g = Graph()
+    g.enable_log(path)
+    for i in range(20):
+        g.add_friendship(f"U{i}", f"U{i + 1}")
+
+    g.checkpoint(background=True)
+    g.add_friendship("U0", "U5")   # goes to the fresh log meanwhile
+    g.wait_for_checkpoint()
+    g.sync()
+
+    assert not os.path.exists(path + ".log.old")
+    restored = Graph()
+    restored.load(path)
+    assert restored.adjacency_list() == g.adjacency_list()
+    g.close_log()
+
+
+def test_torn_log_record_is_ignored(tmp_path):
+    path = str(tmp_path / "graph.json")
+    g = Graph()
+    g.enable_log(path)
+    g.add_friendship("A", "B")
+    g.close_log()
+
+    with open(path + ".log", "a") as f:
+        f.write('["add_friendship", "A", "C')   # crash mid-write
+
+    restored = Graph()
+    restored.load(path)
+    assert restored.get_friends("A") == ["B"]
+    assert not restored.has_user("C")
+
+    restored.enable_log(path)
+    restored.add_friendship("A", "D")
+    restored.close_log()
+
+    again = Graph()
+    again.load(path)
+    assert again.get_friends("A") == ["B", "D"]
+
+
+def test_records_from_earlier_sessions_count_towards_checkpoint(tmp_path, monkeypatch):
+    from social_graph import graph as graph_module
+    monkeypatch.setattr(graph_module, "CHECKPOINT_EVERY", 10)
+    path = str(tmp_path / "graph.json")
+
+    def session(name):
+        g = Graph()
+        g.load(path)
+        g.enable_log(path)
+        opened_with = g._log.records
+        for i in range(4):
+            g.add_friendship(name, f"U{i}")   # + add_user records
+        g.sync()
+        g.wait_for_checkpoint()
+        g.close_log()
+        return opened_with
+
+    assert session("S0") == 0                # 9 records, no checkpoint yet
+    assert session("S1") == 9                # 9 + 5 ≥ 10 → checkpoint
+    assert os.path.getsize(path + ".log") == 0
+
+    with open(path + ".log", "a") as f:
+        f.write('["add_friendship", "S0", "U0"]\n["add_user", "To')   # crash mid-write
+    assert session("S2") == 1
+    restored = Graph()
+    restored.load(path)
+    assert restored.get_friends("U0") == ["S0", "S1", "S2"]
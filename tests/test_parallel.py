@@ -0,0 +1,39 @@
+import random
+
+from social_graph.graph import Graph
+from social_graph.bfs import bfs_multi_source
+from social_graph.parallel import distance_histograms
+
+
+def build_random(seed, n_users=60, n_edges=90):
+    rng = random.Random(seed)
+    g = Graph()
+    for i in range(n_users):
+        g.add_user(f"U{i}")
+    for _ in range(n_edges):
+        g.add_friendship(f"U{rng.randrange(n_users)}", f"U{rng.randrange(n_users)}")
+    return g
+
+
+def test_histograms_match_single_source_bfs():
+    g = build_random(8)
+    stats = distance_histograms(g, workers=1)
+
+    for user in g.get_all_users():
+        distances = bfs_multi_source(g, [user]).distances.values()
+        hist = [0] * (max(distances) + 1)
+        for d in distances:
+            hist[d] += 1
+        assert stats.histograms[user] == hist
+        assert stats.eccentricity[user] == len(hist) - 1
+
+
+def test_process_pool_matches_inline():
+    g = build_random(12)
+    inline = distance_histograms(g, workers=1)
+    pooled = distance_histograms(g, workers=2, chunk_size=8)
+
+    assert pooled.histograms == inline.histograms
+    assert pooled.total_histogram == inline.total_histogram
+    assert pooled.diameter == inline.diameter
+    assert abs(pooled.average_separation - inline.average_separation) < 1e-12
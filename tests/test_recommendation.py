@@ -0,0 +1,57 @@
+import random
+
+from social_graph.graph import Graph
+from social_graph.recommendation import recommend_friends, recommend_friends_batch
+
+
+def test_batch_matches_single_user_recommendations():
+    rng = random.Random(11)
+    g = Graph()
+    for i in range(80):
+        g.add_user(f"U{i}")
+    for _ in range(300):
+        g.add_friendship(f"U{rng.randrange(80)}", f"U{rng.randrange(80)}")
+
+    batch = recommend_friends_batch(g, max_results=4)
+
+    assert set(batch) == set(g.get_all_users())
+    for user in g.get_all_users():
+        assert batch[user] == recommend_friends(g, user, max_results=4)
+
+
+def test_batch_subset_and_unknown_users():
+    g = Graph()
+    g.add_friendship("Alice", "Bob")
+    g.add_friendship("Alice", "Charlie")
+    g.add_friendship("Bob", "David")
+    g.add_friendship("Charlie", "David")
+
+    result = recommend_friends_batch(g.freeze(), ["Alice", "Ghost"])
+
+    assert result == {"Alice": [("David", 2)], "Ghost": []}
+
+
+def test_rank_recommendations_matches_per_candidate_scoring():
+    from social_graph.bfs import bfs_shortest_path
+    from social_graph.recommendation import rank_recommendations
+
+    rng = random.Random(5)
+    g = Graph()
+    for i in range(40):
+        g.add_user(f"U{i}")
+    for _ in range(50):
+        g.add_friendship(f"U{rng.randrange(40)}", f"U{rng.randrange(40)}")
+
+    user = "U0"
+    friends = set(g.get_friends(user))
+    expected = []
+    for other in set(g.get_all_users()) - friends - {user}:
+        mutual = len(friends.intersection(g.get_friends(other)))
+        distance = bfs_shortest_path(g, user, other).distances.get(other)
+        distance_score = 0 if distance is None else 1 / (1 + distance)
+        expected.append((other, mutual * 0.7 + distance_score * 0.3, mutual, distance))
+    expected.sort(key=lambda x: (-x[1], x[0]))
+
+    assert rank_recommendations(g, user) == expected
+    assert rank_recommendations(g, user, max_results=5) == expected[:5]
+    assert rank_recommendations(g, "Ghost") == []
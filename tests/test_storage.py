@@ -0,0 +1,53 @@
+from social_graph.graph import Graph, convert_graph_file
+from social_graph.bfs import bfs_shortest_path
+from social_graph.storage import open_binary
+
+
+def build_sample():
+    g = Graph()
+    g.add_friendship("Alice", "Bob")
+    g.add_friendship("Alice", "Charlie")
+    g.add_friendship("Bob", "Dávid")
+    g.add_friendship("Charlie", "Dávid")
+    g.add_user("Zed")
+    return g
+
+
+def test_binary_round_trip(tmp_path):
+    g = build_sample()
+    g.delete_user("Charlie")  # leaves a tombstone that must not be written
+    path = str(tmp_path / "graph.sgx")
+    g.save(path)
+
+    loaded = Graph()
+    loaded.load(path)
+
+    assert sorted(loaded.get_all_users()) == sorted(g.get_all_users())
+    assert loaded.adjacency_list() == g.adjacency_list()
+
+
+def test_open_binary_is_traversable(tmp_path):
+    g = build_sample()
+    path = str(tmp_path / "graph.sgx")
+    g.save(path)
+
+    csr = open_binary(path)
+
+    assert csr.num_edges() == 4
+    assert csr.get_friends("Alice") == ["Bob", "Charlie"]
+    assert bfs_shortest_path(csr, "Bob", "Charlie").path == ["Bob", "Alice", "Charlie"]
+
+
+def test_convert_between_formats(tmp_path):
+    g = build_sample()
+    json_path = str(tmp_path / "graph.json")
+    bin_path = str(tmp_path / "graph.sgx")
+    back_path = str(tmp_path / "back.json")
+    g.save(json_path)
+
+    convert_graph_file(json_path, bin_path)
+    convert_graph_file(bin_path, back_path)
+
+    back = Graph()
+    back.load(back_path)
+    assert back.adjacency_list() == g.adjacency_list()
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from gui.bfs_window import BFSWindow
+from gui.dfs_window import DFSWindow
+from gui.recommendation_window import RecommendationWindow
+from social_graph.cache import QueryCache
+from social_graph.graph import Graph
+
+
+WINDOWS = (BFSWindow, DFSWindow, RecommendationWindow)
+
+
+def cache_listeners(g):
+    return [l for l in g._listeners if isinstance(getattr(l, "__self__", None), QueryCache)]
+
+
+def test_windows_use_the_shared_cache_even_when_empty():
+    app = QApplication.instance() or QApplication([])
+    g = Graph()
+    g.add_friendship("A", "B")
+    cache = QueryCache(g)
+    assert len(cache) == 0
+
+    for window_class in WINDOWS:
+        window = window_class(g, cache)
+        assert window.cache is cache
+        window.done(0)
+    assert len(cache_listeners(g)) == 1
+
+
+def test_private_cache_stops_listening_when_window_closes():
+    app = QApplication.instance() or QApplication([])
+    g = Graph()
+    g.add_friendship("A", "B")
+
+    for window_class in WINDOWS:
+        window = window_class(g)
+        assert len(cache_listeners(g)) == 1
+        window.done(0)
+        assert cache_listeners(g) == []